@@ -1,5 +1,8 @@
 """Configuration settings for the posting system."""
 
+from functools import lru_cache
+from typing import Any
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,11 +36,19 @@ class Settings(BaseSettings):
     # GitHub
     github_token: str = Field(description="GitHub personal access token")
     github_org: str = Field(default="mwmbl", description="GitHub organization to monitor")
+    github_etag_cache_path: str = Field(
+        default="/tmp/post-github-etags.json",
+        description="File used to cache GitHub ETags between runs",
+    )
 
     # Mwmbl Stats API
     mwmbl_stats_url: str = Field(
         default="https://api.mwmbl.org/api/v1/crawler/stats", description="Mwmbl stats API URL"
     )
+    mwmbl_stats_etag_cache_path: str = Field(
+        default="/tmp/post-mwmbl-stats-etags.json",
+        description="File used to cache the Mwmbl stats ETag between runs",
+    )
 
     # Mastodon
     mastodon_instance_url: str = Field(description="Mastodon instance URL")
@@ -49,6 +60,9 @@ class Settings(BaseSettings):
     x_access_token: str = Field(description="X/Twitter access token")
     x_access_token_secret: str = Field(description="X/Twitter access token secret")
     x_bearer_token: str = Field(description="X/Twitter bearer token")
+    x_max_concurrent_posts: int = Field(
+        default=3, description="Most X posts sent at once"
+    )
 
     # Anthropic Claude
     anthropic_api_key: str = Field(description="Anthropic API key for Claude")
@@ -83,11 +97,24 @@ class Settings(BaseSettings):
     max_daily_posts: int = Field(
         default=10, description="Maximum posts per day per platform"
     )
+    min_ai_summary_activities: int = Field(
+        default=3,
+        description="Fewest weekly activities worth an AI-written summary",
+    )
 
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
     log_file: str = Field(default="post.log", description="Log file path")
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, loading them on first use."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily provide the legacy module-level ``settings`` instance."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
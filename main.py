@@ -1,36 +1,30 @@
 """Main CLI interface for the posting system."""
 
 import asyncio
+import functools
 import sys
 from datetime import datetime, timedelta
+from typing import Any, Callable, Coroutine
 
 import click
 from loguru import logger
 
-from config.settings import settings
-from src.scheduler import TaskScheduler
-from src.storage import db_manager
-
-
-def setup_logging(verbose: bool = False) -> None:
-    """Setup logging configuration."""
-    logger.remove()
-    
-    log_level = "DEBUG" if verbose else settings.log_level
-    
-    logger.add(
-        sys.stderr,
-        level=log_level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
-    )
-    
-    logger.add(
-        settings.log_file,
-        level=log_level,
-        rotation="10 MB",
-        retention="30 days",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
-    )
+from src.bootstrap import ensure_database, get_scheduler, setup_logging, shutdown
+from src.storage import get_db_manager
+
+
+def async_command(f: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..., None]:
+    """Decorator to run an async command in its own event loop."""
+    async def run(*args: Any, **kwargs: Any) -> None:
+        try:
+            await f(*args, **kwargs)
+        finally:
+            await shutdown()
+
+    @functools.wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        return asyncio.run(run(*args, **kwargs))
+    return wrapper
 
 
 @click.group()
@@ -41,10 +35,10 @@ def cli(verbose: bool) -> None:
 
 
 @cli.command()
-async def init_db() -> None:
+def init_db() -> None:
     """Initialize the database tables."""
     try:
-        db_manager.create_tables()
+        get_db_manager().create_tables()
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -52,10 +46,11 @@ async def init_db() -> None:
 
 
 @cli.command()
+@async_command
 async def test_connections() -> None:
     """Test connections to all external services."""
     try:
-        scheduler = TaskScheduler()
+        scheduler = get_scheduler()
         results = await scheduler.test_all_connections()
         
         click.echo("\nConnection Test Results:")
@@ -79,11 +74,12 @@ async def test_connections() -> None:
 
 @cli.command()
 @click.option("--hours", "-h", default=24, help="Hours to look back for activities")
+@async_command
 async def collect(hours: int) -> None:
     """Collect activities from all sources."""
     try:
-        db_manager.create_tables()
-        scheduler = TaskScheduler()
+        ensure_database()
+        scheduler = get_scheduler()
         
         since = datetime.now() - timedelta(hours=hours)
         collected = await scheduler.run_data_collection(since)
@@ -96,11 +92,12 @@ async def collect(hours: int) -> None:
 
 
 @cli.command()
+@async_command
 async def daily_post() -> None:
     """Run daily posting to social media platforms."""
     try:
-        db_manager.create_tables()
-        scheduler = TaskScheduler()
+        ensure_database()
+        scheduler = get_scheduler()
         
         # Collect recent activities first
         since = datetime.now() - timedelta(hours=2)
@@ -128,11 +125,12 @@ async def daily_post() -> None:
 
 
 @cli.command()
+@async_command
 async def weekly_post() -> None:
     """Run weekly posting (blog summary)."""
     try:
-        db_manager.create_tables()
-        scheduler = TaskScheduler()
+        ensure_database()
+        scheduler = get_scheduler()
         
         # Collect activities from the past week
         since = datetime.now() - timedelta(days=7)
@@ -160,10 +158,11 @@ async def weekly_post() -> None:
 
 @cli.command()
 @click.option("--days", "-d", default=7, help="Number of days to show stats for")
+@async_command
 async def stats(days: int) -> None:
     """Show posting statistics."""
     try:
-        scheduler = TaskScheduler()
+        scheduler = get_scheduler()
         stats_data = await scheduler.get_posting_stats(days)
         
         click.echo(f"\nPosting Statistics (Last {days} days):")
@@ -183,6 +182,7 @@ async def stats(days: int) -> None:
 
 
 @cli.command()
+@async_command
 async def cleanup() -> None:
     """Clean up temporary files and repositories."""
     try:
@@ -198,18 +198,5 @@ async def cleanup() -> None:
         sys.exit(1)
 
 
-# Async command wrapper
-def async_command(f):
-    """Decorator to run async commands."""
-    def wrapper(*args, **kwargs):
-        return asyncio.run(f(*args, **kwargs))
-    return wrapper
-
-
-# Apply async wrapper to all async commands
-for command in [init_db, test_connections, collect, daily_post, weekly_post, stats, cleanup]:
-    command.callback = async_command(command.callback)
-
-
 if __name__ == "__main__":
     cli()
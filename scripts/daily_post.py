@@ -6,36 +6,17 @@ from datetime import datetime, timedelta
 
 from loguru import logger
 
-from config.settings import settings
-from src.scheduler import TaskScheduler
-from src.storage import db_manager
+from src.bootstrap import bootstrap, get_scheduler, shutdown
 
 
 async def main() -> None:
     """Run daily data collection and posting."""
-    # Configure logging
-    logger.remove()
-    logger.add(
-        sys.stderr,
-        level=settings.log_level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
-    )
-    logger.add(
-        settings.log_file,
-        level=settings.log_level,
-        rotation="10 MB",
-        retention="30 days",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
-    )
-
-    logger.info("Starting daily posting process")
-    
     try:
-        # Initialize database
-        db_manager.create_tables()
+        # Configure logging and the database
+        bootstrap()
+        logger.info("Starting daily posting process")
         
-        # Initialize scheduler
-        scheduler = TaskScheduler()
+        scheduler = get_scheduler()
         
         # Test connections first
         connection_results = await scheduler.test_all_connections()
@@ -70,6 +51,8 @@ async def main() -> None:
     except Exception as e:
         logger.error(f"Daily posting process failed: {e}")
         sys.exit(1)
+    finally:
+        await shutdown()
 
 
 if __name__ == "__main__":
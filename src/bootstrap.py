@@ -0,0 +1,73 @@
+"""Process start-up shared by the CLI and the deployment scripts."""
+
+import sys
+from functools import lru_cache
+
+from loguru import logger
+
+from config.settings import get_settings
+from src.scheduler import TaskScheduler
+from src.storage import get_db_manager
+
+_initialized = False
+_database_ready = False
+
+
+def setup_logging(verbose: bool = False) -> None:
+    """Setup logging configuration."""
+    logger.remove()
+
+    log_level = "DEBUG" if verbose else get_settings().log_level
+
+    logger.add(
+        sys.stderr,
+        level=log_level,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+    )
+
+    logger.add(
+        get_settings().log_file,
+        level=log_level,
+        rotation="10 MB",
+        retention="30 days",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+    )
+
+
+def ensure_database() -> None:
+    """Create the database tables once per process if they are missing."""
+    global _database_ready
+    if _database_ready:
+        return
+
+    db_manager = get_db_manager()
+    if not db_manager.tables_exist():
+        db_manager.create_tables()
+    _database_ready = True
+
+
+def bootstrap(verbose: bool = False) -> None:
+    """Configure logging and the database once per process.
+
+    Args:
+        verbose: Enable debug logging
+    """
+    global _initialized
+    if _initialized:
+        return
+
+    setup_logging(verbose)
+    ensure_database()
+    _initialized = True
+
+
+@lru_cache(maxsize=1)
+def get_scheduler() -> TaskScheduler:
+    """Get the process-wide task scheduler."""
+    return TaskScheduler()
+
+
+async def shutdown() -> None:
+    """Close the task scheduler's connections if it was created."""
+    if get_scheduler.cache_info().currsize:
+        await get_scheduler().aclose()
@@ -1,8 +1,24 @@
 """Data collectors for various sources."""
 
+from typing import Any
+
 from .base import BaseCollector
-from .github_collector import GitHubCollector
-from .matrix_collector import MatrixCollector
-from .mwmbl_stats_collector import MwmblStatsCollector
 
 __all__ = ["BaseCollector", "GitHubCollector", "MatrixCollector", "MwmblStatsCollector"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import collector classes on first access to keep package import cheap."""
+    if name == "GitHubCollector":
+        from .github_collector import GitHubCollector
+
+        return GitHubCollector
+    if name == "MatrixCollector":
+        from .matrix_collector import MatrixCollector
+
+        return MatrixCollector
+    if name == "MwmblStatsCollector":
+        from .mwmbl_stats_collector import MwmblStatsCollector
+
+        return MwmblStatsCollector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
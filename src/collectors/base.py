@@ -1,15 +1,20 @@
 """Base collector class for all data collectors."""
 
-import json
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from loguru import logger
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
 
 from src.storage import Activity, ActivityType, get_db_session
 
+# Number of activities written to the database per insert statement
+SAVE_BATCH_SIZE = 500
+
 
 class BaseCollector(ABC):
     """Base class for all data collectors."""
@@ -35,6 +40,26 @@ class BaseCollector(ABC):
         """
         pass
 
+    async def iter_collect(
+        self, since: Optional[datetime] = None
+    ) -> AsyncIterator[Activity]:
+        """Yield activities from the source as they are collected.
+
+        Collectors that can produce results incrementally should override this
+        so that activities can be saved without buffering the whole run.
+
+        Args:
+            since: Only collect activities created after this datetime
+
+        Yields:
+            Collected activities
+        """
+        for activity in await self.collect(since):
+            yield activity
+
+    async def aclose(self) -> None:
+        """Release any network resources held by the collector."""
+
     def _create_activity(
         self,
         source_id: str,
@@ -70,34 +95,71 @@ class BaseCollector(ABC):
             url=url,
             author=author,
             is_newsworthy=is_newsworthy,
-            extra_data=json.dumps(extra_data) if extra_data else None,
+            extra_data=extra_data if extra_data else None,
         )
 
-    def _save_activities(self, activities: List[Activity]) -> int:
+    def _save_activities(self, session: Session, activities: List[Activity]) -> int:
         """Save activities to the database.
         
         Args:
+            session: Database session to write through
             activities: List of activities to save
             
         Returns:
             Number of activities successfully saved
         """
-        saved_count = 0
-        
-        with get_db_session() as session:
-            for activity in activities:
-                try:
-                    session.add(activity)
-                    session.flush()  # Flush to get any database errors
-                    saved_count += 1
-                    self.logger.debug(f"Saved activity: {activity.title}")
-                except IntegrityError:
-                    session.rollback()
-                    self.logger.debug(f"Activity already exists: {activity.source_id}")
-                except Exception as e:
-                    session.rollback()
-                    self.logger.error(f"Error saving activity {activity.source_id}: {e}")
-                    
+        if not activities:
+            self.logger.info("Saved 0 new activities")
+            return 0
+
+        # Collection windows overlap between runs, so most activities are
+        # usually already stored; find them with one probe and only insert the
+        # remainder
+        source_ids = [activity.source_id for activity in activities]
+        existing = set(
+            session.scalars(
+                select(Activity.source_id).where(
+                    Activity.activity_type == self.activity_type,
+                    Activity.source_id.in_(source_ids),
+                )
+            )
+        )
+
+        rows = [
+            {
+                "activity_type": activity.activity_type,
+                "source_id": activity.source_id,
+                "title": activity.title,
+                "content": activity.content,
+                "url": activity.url,
+                "author": activity.author,
+                "created_at": activity.created_at,
+                "is_newsworthy": activity.is_newsworthy,
+                "extra_data": activity.extra_data,
+            }
+            for activity in activities
+            if activity.source_id not in existing
+        ]
+
+        if not rows:
+            self.logger.debug(f"Skipped {len(activities)} existing activities")
+            self.logger.info("Saved 0 new activities")
+            return 0
+
+        # Insert the remainder in one statement; conflicts can still occur for
+        # duplicates within the batch or concurrent runs, and those rows are
+        # skipped by the database and don't appear in the RETURNING result
+        table = Activity.__table__
+        stmt = (
+            insert(table)
+            .values(rows)
+            .on_conflict_do_nothing(constraint="unique_activity")
+            .returning(table.c.id)
+        )
+
+        saved_count = len(session.execute(stmt).fetchall())
+
+        self.logger.debug(f"Skipped {len(activities) - saved_count} existing activities")
         self.logger.info(f"Saved {saved_count} new activities")
         return saved_count
 
@@ -112,10 +174,47 @@ class BaseCollector(ABC):
         """
         try:
             self.logger.info(f"Starting collection for {self.activity_type}")
-            activities = await self.collect(since)
-            saved_count = self._save_activities(activities)
+            saved_count = 0
+            batch: List[Activity] = []
+
+            # Each batch is committed on its own, so a late failure keeps
+            # what was already saved and no transaction spans the network I/O
+            async for activity in self.iter_collect(since):
+                batch.append(activity)
+                if len(batch) >= SAVE_BATCH_SIZE:
+                    saved_count += await self._save_batch(batch)
+                    batch = []
+
+            if batch:
+                saved_count += await self._save_batch(batch)
+
             self.logger.info(f"Collection completed: {saved_count} activities saved")
             return saved_count
         except Exception as e:
             self.logger.error(f"Collection failed: {e}")
             raise
+
+    async def _save_batch(self, activities: List[Activity]) -> int:
+        """Save and commit a batch of activities without blocking the event loop.
+
+        Args:
+            activities: Activities to save
+
+        Returns:
+            Number of activities successfully saved
+        """
+        # The database driver is blocking; keep the event loop free for
+        # other collectors while the batch is written
+        return await asyncio.to_thread(self._save_batch_sync, activities)
+
+    def _save_batch_sync(self, activities: List[Activity]) -> int:
+        """Save a batch of activities in its own session and transaction.
+
+        Args:
+            activities: Activities to save
+
+        Returns:
+            Number of activities successfully saved
+        """
+        with get_db_session() as session:
+            return self._save_activities(session, activities)
@@ -0,0 +1,76 @@
+"""Persistent ETag cache for conditional HTTP requests."""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+from loguru import logger
+
+
+class ETagCache:
+    """Stores response validators and payloads keyed by request URL.
+
+    Entries are kept in a small JSON file so that conditional requests can be
+    made across runs; a ``304 Not Modified`` response is then answered from
+    the stored payload.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: File the cache is persisted to
+        """
+        self.path = Path(path)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Cached entries, loaded from disk on first access."""
+        if self._entries is None:
+            try:
+                self._entries = orjson.loads(self.path.read_bytes())
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, orjson.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable ETag cache {self.path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the cached entry for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Entry with ``etag`` and ``data`` keys, or None if not cached
+        """
+        return self.entries.get(url)
+
+    def set(self, url: str, etag: str, data: Any) -> None:
+        """Store the validator and payload for a URL.
+
+        Args:
+            url: Request URL
+            etag: ETag header returned for the URL
+            data: JSON-serializable payload to return on a 304 response
+        """
+        self.entries[url] = {"etag": etag, "data": data}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it has changed."""
+        if not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            tmp_path.write_bytes(orjson.dumps(self.entries))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save ETag cache {self.path}: {e}")
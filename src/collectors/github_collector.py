@@ -1,15 +1,168 @@
 """GitHub activity collector."""
 
+import asyncio
 from datetime import datetime, timezone
-from typing import List, Optional
+from functools import cached_property
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    TypedDict,
+    TypeVar,
+)
 
-from github import Github
-from github.PaginatedList import PaginatedList
+import httpx
+import orjson
 
-from config.settings import settings
+from config.settings import get_settings
 from src.storage import Activity, ActivityType
 
 from .base import BaseCollector
+from .etag_cache import ETagCache
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+# Number of repositories fetched per GraphQL request (one alias per repo)
+REPOS_PER_QUERY = 10
+
+# Maximum number of GraphQL requests in flight at once
+MAX_CONCURRENT_QUERIES = 8
+
+# Issue labels that make an open issue newsworthy
+_NEWSWORTHY_LABELS = frozenset({"bug", "enhancement", "feature"})
+
+T = TypeVar("T")
+
+
+class Connection(TypedDict, Generic[T]):
+    """A GraphQL connection with its nodes inlined."""
+
+    nodes: List[T]
+
+
+class Login(TypedDict):
+    """A GitHub actor reference."""
+
+    login: str
+
+
+class LabelNode(TypedDict):
+    """An issue label."""
+
+    name: str
+
+
+class PullRequestNode(TypedDict):
+    """Pull request fields requested by the repository query."""
+
+    number: int
+    title: str
+    body: str
+    createdAt: str
+    url: str
+    state: str
+    merged: bool
+    additions: int
+    deletions: int
+    author: Optional[Login]
+
+
+class IssueNode(TypedDict):
+    """Issue fields requested by the repository query."""
+
+    number: int
+    title: str
+    body: str
+    createdAt: str
+    url: str
+    state: str
+    author: Optional[Login]
+    labels: Connection[LabelNode]
+
+
+class ReleaseNode(TypedDict):
+    """Release fields requested by the repository query."""
+
+    databaseId: int
+    tagName: str
+    name: Optional[str]
+    description: Optional[str]
+    createdAt: str
+    url: str
+    isPrerelease: bool
+    isDraft: bool
+    author: Optional[Login]
+
+
+class CommitAuthor(TypedDict):
+    """Git author of a commit, with the linked GitHub user if any."""
+
+    name: Optional[str]
+    user: Optional[Login]
+
+
+class CommitNode(TypedDict):
+    """Commit fields requested by the repository query."""
+
+    oid: str
+    message: str
+    authoredDate: str
+    url: str
+    changedFilesIfAvailable: Optional[int]
+    author: Optional[CommitAuthor]
+
+
+class RepositoryNode(TypedDict):
+    """Repository activity returned for each alias in a batched query."""
+
+    name: str
+    pullRequests: Connection[PullRequestNode]
+    issues: Connection[IssueNode]
+    releases: Connection[ReleaseNode]
+    defaultBranchRef: Optional[Dict[str, Any]]
+
+
+REPOSITORY_FRAGMENT = """
+fragment RepositoryActivity on Repository {
+  name
+  pullRequests(first: 50, orderBy: {field: UPDATED_AT, direction: DESC}) {
+    nodes {
+      number title body createdAt url state merged additions deletions
+      author { login }
+    }
+  }
+  issues(first: 50, orderBy: {field: UPDATED_AT, direction: DESC}, filterBy: {since: $since}) {
+    nodes {
+      number title body createdAt url state
+      author { login }
+      labels(first: 20) { nodes { name } }
+    }
+  }
+  releases(first: 20, orderBy: {field: CREATED_AT, direction: DESC}) {
+    nodes {
+      databaseId tagName name description createdAt url isPrerelease isDraft
+      author { login }
+    }
+  }
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        history(first: 10, since: $commitsSince) {
+          nodes {
+            oid message authoredDate url changedFilesIfAvailable
+            author { name user { login } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
 
 
 class GitHubCollector(BaseCollector):
@@ -18,219 +171,341 @@ class GitHubCollector(BaseCollector):
     def __init__(self) -> None:
         """Initialize the GitHub collector."""
         super().__init__(ActivityType.GITHUB_PR)
-        self.github = Github(settings.github_token)
-        self.org = self.github.get_organization(settings.github_org)
+
+    @cached_property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for the GitHub API, created on first use."""
+        return httpx.AsyncClient(
+            headers={"Authorization": f"bearer {get_settings().github_token}"},
+            timeout=30.0,
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it was created."""
+        if "client" in self.__dict__:
+            await self.client.aclose()
+            del self.client
+
+    @cached_property
+    def etag_cache(self) -> ETagCache:
+        """ETag cache for conditional REST requests."""
+        return ETagCache(get_settings().github_etag_cache_path)
 
     async def collect(self, since: Optional[datetime] = None) -> List[Activity]:
         """Collect GitHub activities.
-        
+
         Args:
             since: Only collect activities created after this datetime
-            
+
         Returns:
             List of collected activities
         """
-        activities = []
-        
+        return [activity async for activity in self.iter_collect(since)]
+
+    async def iter_collect(
+        self, since: Optional[datetime] = None
+    ) -> AsyncIterator[Activity]:
+        """Yield GitHub activities as each batch of repositories is fetched.
+
+        Args:
+            since: Only collect activities created after this datetime
+
+        Yields:
+            Collected activities
+        """
+        # GitHub timestamps are UTC; normalize the cutoff once so items can be
+        # compared directly (naive datetimes are assumed to be UTC)
+        if since and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
         # Get all repositories in the organization
-        repos = self.org.get_repos()
-        
+        repo_names = await self._list_repositories()
+
+        # Fetch PRs, issues, releases and commits for several repos per request,
+        # running the requests concurrently but capped to respect rate limits
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        tasks = [
+            asyncio.create_task(
+                self._collect_batch(repo_names[start:start + REPOS_PER_QUERY], since, semaphore)
+            )
+            for start in range(0, len(repo_names), REPOS_PER_QUERY)
+        ]
+
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                for activity in await next_batch:
+                    yield activity
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _collect_batch(
+        self,
+        names: List[str],
+        since: Optional[datetime],
+        semaphore: asyncio.Semaphore,
+    ) -> List[Activity]:
+        """Collect activities for a batch of repositories."""
+        activities = []
+
+        async with semaphore:
+            self.logger.debug(f"Collecting activities from {', '.join(names)}")
+            try:
+                repos = await self._query_repositories(names, since)
+            except Exception as e:
+                self.logger.error(f"Error collecting activities from {', '.join(names)}: {e}")
+                return activities
+
         for repo in repos:
-            self.logger.debug(f"Collecting activities from {repo.name}")
-            
-            # Collect pull requests
-            activities.extend(await self._collect_pull_requests(repo, since))
-            
-            # Collect issues
-            activities.extend(await self._collect_issues(repo, since))
-            
-            # Collect releases
-            activities.extend(await self._collect_releases(repo, since))
-            
-            # Collect recent commits (only from main/master branch)
-            activities.extend(await self._collect_commits(repo, since))
-        
+            activities.extend(self._parse_repository(repo, since))
+
         return activities
 
-    def _compare_datetime(self, dt1: datetime, dt2: datetime) -> bool:
-        """Compare two datetimes, handling timezone awareness.
-        
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query against the GitHub API.
+
         Args:
-            dt1: First datetime (from GitHub API)
-            dt2: Second datetime (from our system)
-            
+            query: GraphQL query document
+            variables: Query variables
+
         Returns:
-            True if dt1 < dt2
+            The ``data`` member of the response
         """
-        # If dt2 is naive, make it timezone-aware (assume UTC)
-        if dt2.tzinfo is None:
-            dt2 = dt2.replace(tzinfo=timezone.utc)
-        
-        # If dt1 is naive, make it timezone-aware (assume UTC)
-        if dt1.tzinfo is None:
-            dt1 = dt1.replace(tzinfo=timezone.utc)
-        
-        return dt1 < dt2
-
-    async def _collect_pull_requests(self, repo, since: Optional[datetime] = None) -> List[Activity]:
-        """Collect pull requests from a repository."""
-        activities = []
-        
-        try:
-            prs = repo.get_pulls(state="all", sort="updated", direction="desc")
-            
-            for pr in prs:
-                if since and self._compare_datetime(pr.created_at, since):
-                    break
-                    
-                # Determine if this PR is newsworthy
-                is_newsworthy = (
-                    pr.state == "closed" and pr.merged and
-                    (pr.additions + pr.deletions) > 10  # Significant changes
-                )
-                
-                activity = self._create_activity(
-                    source_id=f"pr_{repo.name}_{pr.number}",
-                    title=f"PR #{pr.number}: {pr.title}",
-                    content=pr.body or f"Pull request in {repo.name}",
-                    created_at=pr.created_at,
-                    url=pr.html_url,
-                    author=pr.user.login if pr.user else None,
-                    extra_data={
-                        "repo": repo.name,
-                        "state": pr.state,
-                        "merged": pr.merged,
-                        "additions": pr.additions,
-                        "deletions": pr.deletions,
-                    },
-                    is_newsworthy=is_newsworthy,
-                )
-                activities.append(activity)
-                
-        except Exception as e:
-            self.logger.error(f"Error collecting PRs from {repo.name}: {e}")
-            
-        return activities
+        response = await self.client.post(
+            GITHUB_GRAPHQL_URL, json={"query": query, "variables": variables}
+        )
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
 
-    async def _collect_issues(self, repo, since: Optional[datetime] = None) -> List[Activity]:
-        """Collect issues from a repository."""
-        activities = []
-        
-        try:
-            issues = repo.get_issues(state="all", sort="updated", direction="desc")
-            
-            for issue in issues:
-                if issue.pull_request:  # Skip PRs (they appear as issues too)
-                    continue
-                    
-                if since and self._compare_datetime(issue.created_at, since):
-                    break
-                
-                # Issues are newsworthy if they're labeled as important or are closed
-                labels = [label.name.lower() for label in issue.labels]
-                is_newsworthy = (
-                    issue.state == "closed" or
-                    any(label in labels for label in ["bug", "enhancement", "feature"])
-                )
-                
-                activity = self._create_activity(
-                    source_id=f"issue_{repo.name}_{issue.number}",
-                    title=f"Issue #{issue.number}: {issue.title}",
-                    content=issue.body or f"Issue in {repo.name}",
-                    created_at=issue.created_at,
-                    url=issue.html_url,
-                    author=issue.user.login if issue.user else None,
-                    extra_data={
-                        "repo": repo.name,
-                        "state": issue.state,
-                        "labels": labels,
-                    },
-                    is_newsworthy=is_newsworthy,
-                )
-                activities.append(activity)
-                
-        except Exception as e:
-            self.logger.error(f"Error collecting issues from {repo.name}: {e}")
-            
-        return activities
+        if payload.get("errors"):
+            self.logger.warning(f"GitHub GraphQL errors: {payload['errors']}")
+        if not payload.get("data"):
+            raise RuntimeError(f"GitHub GraphQL query returned no data: {payload.get('errors')}")
+
+        return payload["data"]
+
+    async def _get_conditional(self, url: str, fields: Sequence[str]) -> Dict[str, Any]:
+        """Fetch a page of a REST listing, revalidating any cached copy.
+
+        A ``304 Not Modified`` response doesn't count against the rate limit
+        and carries no body, so unchanged pages cost next to nothing.
+
+        Args:
+            url: Request URL, including query parameters
+            fields: Fields to keep from each item, so the cache stays small
+
+        Returns:
+            Dictionary with the decoded ``items`` and the ``next`` page URL
+        """
+        cached = self.etag_cache.get(url)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+        response = await self.client.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached["data"]
+        response.raise_for_status()
+
+        data = {
+            "items": [
+                {field: item[field] for field in fields}
+                for item in orjson.loads(response.content)
+            ],
+            "next": response.links.get("next", {}).get("url"),
+        }
+        etag = response.headers.get("ETag")
+        if etag:
+            self.etag_cache.set(url, etag, data)
+        return data
+
+    async def _list_repositories(self) -> List[str]:
+        """List the names of the organization's active source repositories.
+
+        Forks are excluded by the API; archived and empty repositories can't
+        have new activity, so they are skipped too.
+        """
+        names = []
+        url: Optional[str] = (
+            f"{GITHUB_API_URL}/orgs/{get_settings().github_org}/repos"
+            "?type=sources&per_page=100"
+        )
 
-    async def _collect_releases(self, repo, since: Optional[datetime] = None) -> List[Activity]:
-        """Collect releases from a repository."""
-        activities = []
-        
         try:
-            releases = repo.get_releases()
-            
-            for release in releases:
-                if since and self._compare_datetime(release.created_at, since):
-                    break
-                
-                # All releases are newsworthy
-                activity = self._create_activity(
-                    source_id=f"release_{repo.name}_{release.id}",
-                    title=f"Release {release.tag_name}: {release.name or release.tag_name}",
-                    content=release.body or f"New release in {repo.name}",
-                    created_at=release.created_at,
-                    url=release.html_url,
-                    author=release.author.login if release.author else None,
-                    extra_data={
-                        "repo": repo.name,
-                        "tag_name": release.tag_name,
-                        "prerelease": release.prerelease,
-                        "draft": release.draft,
-                    },
-                    is_newsworthy=True,
+            while url:
+                page = await self._get_conditional(url, ("name", "archived", "size"))
+                names.extend(
+                    repo["name"]
+                    for repo in page["items"]
+                    if not repo["archived"] and repo["size"] > 0
                 )
-                activities.append(activity)
-                
-        except Exception as e:
-            self.logger.error(f"Error collecting releases from {repo.name}: {e}")
-            
-        return activities
+                url = page["next"]
+        finally:
+            self.etag_cache.save()
+
+        return names
+
+    async def _query_repositories(
+        self, names: List[str], since: Optional[datetime] = None
+    ) -> List[RepositoryNode]:
+        """Fetch recent activity for several repositories in a single request.
+
+        Issues and commits are bounded server-side by ``since``; pull requests
+        and releases are returned newest-first and cut off while parsing.
 
-    async def _collect_commits(self, repo, since: Optional[datetime] = None) -> List[Activity]:
-        """Collect recent commits from the main branch."""
+        Args:
+            names: Repository names within the organization
+            since: Only fetch issues and commits from after this timezone-aware
+                datetime
+
+        Returns:
+            Repository nodes, one per repository that could be resolved
+        """
+        params = ", ".join(f"$name{i}: String!" for i in range(len(names)))
+        aliases = "\n".join(
+            f"  repo{i}: repository(owner: $owner, name: $name{i}) {{ ...RepositoryActivity }}"
+            for i in range(len(names))
+        )
+        query = (
+            f"query($owner: String!, $since: DateTime, $commitsSince: GitTimestamp, {params}) "
+            f"{{\n{aliases}\n}}\n"
+            f"{REPOSITORY_FRAGMENT}"
+        )
+
+        since_iso = since.isoformat() if since else None
+        variables: Dict[str, Any] = {
+            "owner": get_settings().github_org,
+            "since": since_iso,
+            "commitsSince": since_iso,
+        }
+        variables.update({f"name{i}": name for i, name in enumerate(names)})
+
+        data = await self._graphql(query, variables)
+        return [repo for repo in data.values() if repo]
+
+    def _parse_repository(
+        self, repo: RepositoryNode, since: Optional[datetime] = None
+    ) -> List[Activity]:
+        """Convert a repository node into activities.
+
+        Args:
+            repo: Repository node from the GraphQL response
+            since: Timezone-aware cutoff; older items are skipped
+
+        Returns:
+            Activities for the repository's PRs, issues, releases and commits
+        """
         activities = []
-        
-        try:
-            # Get the default branch
-            default_branch = repo.default_branch
-            commits = repo.get_commits(sha=default_branch)
-            
-            # Only collect the most recent commits (limit to avoid spam)
-            commit_count = 0
-            for commit in commits:
-                if commit_count >= 10:  # Limit to 10 most recent commits
-                    break
-                    
-                if since and self._compare_datetime(commit.commit.author.date, since):
-                    break
-                
-                # Commits are newsworthy if they're significant (multiple files changed)
-                try:
-                    files_changed = len(list(commit.files)) if commit.files else 0
-                except (TypeError, AttributeError):
-                    files_changed = 0
-                is_newsworthy = files_changed > 3
-                
-                activity = self._create_activity(
-                    source_id=f"commit_{repo.name}_{commit.sha}",
-                    title=f"Commit: {commit.commit.message.split('\n')[0][:100]}",
-                    content=commit.commit.message,
-                    created_at=commit.commit.author.date,
-                    url=commit.html_url,
-                    author=commit.author.login if commit.author else commit.commit.author.name,
-                    extra_data={
-                        "repo": repo.name,
-                        "sha": commit.sha,
-                        "files_changed": files_changed,
-                    },
-                    is_newsworthy=is_newsworthy,
-                )
-                activities.append(activity)
-                commit_count += 1
-                
-        except Exception as e:
-            self.logger.error(f"Error collecting commits from {repo.name}: {e}")
-            
+        repo_name = repo["name"]
+
+        # Pull requests
+        for pr in repo["pullRequests"]["nodes"]:
+            created_at = datetime.fromisoformat(pr["createdAt"])
+            if since and created_at < since:
+                break
+
+            # GraphQL reports merged PRs as a separate state
+            state = "closed" if pr["state"] == "MERGED" else pr["state"].lower()
+
+            # Determine if this PR is newsworthy
+            is_newsworthy = (
+                state == "closed" and pr["merged"] and
+                (pr["additions"] + pr["deletions"]) > 10  # Significant changes
+            )
+
+            activities.append(self._create_activity(
+                source_id=f"pr_{repo_name}_{pr['number']}",
+                title=f"PR #{pr['number']}: {pr['title']}",
+                content=pr["body"] or f"Pull request in {repo_name}",
+                created_at=created_at,
+                url=pr["url"],
+                author=pr["author"]["login"] if pr["author"] else None,
+                extra_data={
+                    "repo": repo_name,
+                    "state": state,
+                    "merged": pr["merged"],
+                    "additions": pr["additions"],
+                    "deletions": pr["deletions"],
+                },
+                is_newsworthy=is_newsworthy,
+            ))
+
+        # Issues (the GraphQL issues connection does not include PRs). The
+        # query only returns issues updated since ``since``; skip older ones.
+        for issue in repo["issues"]["nodes"]:
+            created_at = datetime.fromisoformat(issue["createdAt"])
+            if since and created_at < since:
+                continue
+
+            state = issue["state"].lower()
+
+            # Issues are newsworthy if they're labeled as important or are closed
+            labels = [label["name"].lower() for label in issue["labels"]["nodes"]]
+            is_newsworthy = (
+                state == "closed" or not _NEWSWORTHY_LABELS.isdisjoint(labels)
+            )
+
+            activities.append(self._create_activity(
+                source_id=f"issue_{repo_name}_{issue['number']}",
+                title=f"Issue #{issue['number']}: {issue['title']}",
+                content=issue["body"] or f"Issue in {repo_name}",
+                created_at=created_at,
+                url=issue["url"],
+                author=issue["author"]["login"] if issue["author"] else None,
+                extra_data={
+                    "repo": repo_name,
+                    "state": state,
+                    "labels": labels,
+                },
+                is_newsworthy=is_newsworthy,
+            ))
+
+        # Releases (all releases are newsworthy)
+        for release in repo["releases"]["nodes"]:
+            created_at = datetime.fromisoformat(release["createdAt"])
+            if since and created_at < since:
+                break
+
+            tag_name = release["tagName"]
+            activities.append(self._create_activity(
+                source_id=f"release_{repo_name}_{release['databaseId']}",
+                title=f"Release {tag_name}: {release['name'] or tag_name}",
+                content=release["description"] or f"New release in {repo_name}",
+                created_at=created_at,
+                url=release["url"],
+                author=release["author"]["login"] if release["author"] else None,
+                extra_data={
+                    "repo": repo_name,
+                    "tag_name": tag_name,
+                    "prerelease": release["isPrerelease"],
+                    "draft": release["isDraft"],
+                },
+                is_newsworthy=True,
+            ))
+
+        # Recent commits from the default branch (limited to 10 and bounded by
+        # ``since`` in the query)
+        branch = repo["defaultBranchRef"]
+        history = branch["target"].get("history") if branch else None
+        for commit in history["nodes"] if history else []:
+            created_at = datetime.fromisoformat(commit["authoredDate"])
+
+            # Commits are newsworthy if they're significant (multiple files changed)
+            files_changed = commit["changedFilesIfAvailable"] or 0
+            is_newsworthy = files_changed > 3
+
+            author = commit["author"] or {}
+            activities.append(self._create_activity(
+                source_id=f"commit_{repo_name}_{commit['oid']}",
+                title=f"Commit: {commit['message'].split('\n')[0][:100]}",
+                content=commit["message"],
+                created_at=created_at,
+                url=commit["url"],
+                author=author["user"]["login"] if author.get("user") else author.get("name"),
+                extra_data={
+                    "repo": repo_name,
+                    "sha": commit["oid"],
+                    "files_changed": files_changed,
+                },
+                is_newsworthy=is_newsworthy,
+            ))
+
         return activities
@@ -2,16 +2,69 @@
 
 import asyncio
 import os
-from datetime import datetime
-from typing import List, Optional
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 
 from nio import AsyncClient, LoginResponse, MatrixRoom, RoomMessageText, RoomMemberEvent, RoomMessage
 
-from config.settings import settings
+from config.settings import get_settings
 from src.storage import Activity, ActivityType
 
 from .base import BaseCollector
 
+# Messages about new members, releases, or important updates. Single words
+# are matched as whole words (so "version" doesn't match "subversion"),
+# including their common inflections
+_NEWSWORTHY_WORDS = frozenset({
+    "welcome",
+    "release", "releases", "released",
+    "update", "updates", "updated",
+    "announcement", "announcements",
+    "important",
+    "breaking",
+    "feature", "features",
+    "milestone", "milestones",
+    "version", "versions",
+    "launch", "launches", "launched",
+    "deployed",
+})
+
+# Multi-word keywords, matched as substrings of the lowercased message
+_NEWSWORTHY_PHRASES = ("new member", "bug fix")
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Server-side event filters: only room messages are collected, so don't have
+# the homeserver send (or nio parse) membership, reaction or state events
+MESSAGE_FILTER = {"types": ["m.room.message"], "lazy_load_members": True}
+SYNC_FILTER = {
+    "room": {
+        "timeline": {"types": ["m.room.message"]},
+        "state": {"lazy_load_members": True},
+    },
+}
+
+# Events requested per room_messages page, and the most history to page
+# through when there's no cutoff
+MESSAGES_PAGE_SIZE = 100
+MAX_HISTORY_EVENTS = 500
+
+
+@lru_cache(maxsize=1024)
+def _has_newsworthy_keywords(content: str) -> bool:
+    """Check message content for newsworthy keywords.
+
+    Cached because bot echoes, templated messages and re-delivered events
+    repeat the same bodies.
+    """
+    content_lower = content.lower()
+    return not _NEWSWORTHY_WORDS.isdisjoint(_WORD_RE.findall(content_lower)) or any(
+        phrase in content_lower for phrase in _NEWSWORTHY_PHRASES
+    )
+
 
 class MatrixCollector(BaseCollector):
     """Collects activities from Matrix rooms."""
@@ -20,8 +73,8 @@ class MatrixCollector(BaseCollector):
         """Initialize the Matrix collector."""
         super().__init__(ActivityType.MATRIX_POST)
         # Construct user ID from username and homeserver
-        homeserver_domain = settings.matrix_homeserver.split("://")[-1]
-        self.user_id = f"@{settings.matrix_username}:{homeserver_domain}"
+        homeserver_domain = get_settings().matrix_homeserver.split("://")[-1]
+        self.user_id = f"@{get_settings().matrix_username}:{homeserver_domain}"
         
         # Create store directory for encryption keys
         store_path = os.path.expanduser("~/.local/share/matrix-post-bot")
@@ -29,7 +82,7 @@ class MatrixCollector(BaseCollector):
         
         # Initialize client with encryption support
         self.client = AsyncClient(
-            settings.matrix_homeserver, 
+            get_settings().matrix_homeserver, 
             self.user_id,
             store_path=store_path
         )
@@ -46,7 +99,7 @@ class MatrixCollector(BaseCollector):
             
         try:
             self.logger.info("Logging in to Matrix...")
-            response = await self.client.login(settings.matrix_password)
+            response = await self.client.login(get_settings().matrix_password)
             
             if isinstance(response, LoginResponse):
                 self.logger.info(f"Successfully logged in as {response.user_id}")
@@ -69,131 +122,178 @@ class MatrixCollector(BaseCollector):
         Returns:
             List of collected activities
         """
-        activities = []
+        return [activity async for activity in self.iter_collect(since)]
+
+    async def iter_collect(
+        self, since: Optional[datetime] = None
+    ) -> AsyncIterator[Activity]:
+        """Yield Matrix room activities as events are processed.
+        
+        Args:
+            since: Only collect activities created after this datetime
+            
+        Yields:
+            Collected activities
+        """
+        room_id = get_settings().matrix_room_id
+        room_url_prefix = f"https://matrix.to/#/{room_id}/"
         
         try:
             # Ensure we're logged in
             if not await self._ensure_logged_in():
                 self.logger.error("Failed to log in to Matrix")
-                return activities
+                return
             
             # Sync first to get room data
             self.logger.info("Syncing to get room data...")
-            await self.client.sync(timeout=30000)
+            await self.client.sync(timeout=30000, sync_filter=SYNC_FILTER)
             
-            # Join the room if not already joined
-            try:
-                await self.client.join(settings.matrix_room_id)
-            except Exception as e:
-                self.logger.warning(f"Could not join room (might already be joined): {e}")
+            # Join the room only if we aren't a member yet, then sync again so
+            # the room shows up in the client's state
+            if room_id not in self.client.rooms:
+                try:
+                    await self.client.join(room_id)
+                    await self.client.sync(timeout=30000, sync_filter=SYNC_FILTER)
+                except Exception as e:
+                    self.logger.warning(f"Could not join room: {e}")
             
             # Get room messages
-            room = self.client.rooms.get(settings.matrix_room_id)
+            room = self.client.rooms.get(room_id)
             if not room:
-                self.logger.error(f"Could not find room {settings.matrix_room_id}")
+                self.logger.error(f"Could not find room {room_id}")
                 self.logger.info(f"Available rooms: {list(self.client.rooms.keys())[:5]}...")  # Show first 5 room IDs
-                return activities
+                return
+            
+            # Compare raw server timestamps (ms since the epoch) against the
+            # cutoff so only events we keep are converted to datetimes
+            since_ms = int(since.timestamp() * 1000) if since else None
+            
+            # Only one of the timeline or the fallback below runs, so they
+            # share the tally of event types seen
+            event_types: Counter[str] = Counter()
             
             # Try to get messages from the room's timeline after sync
             self.logger.info("Checking room timeline for recent messages...")
             
             # Check if the room has any timeline events
             if hasattr(room, 'timeline') and room.timeline:
-                self.logger.info(f"Processing {len(room.timeline.events)} events from room timeline")
+                events = room.timeline.events
+                event_count = len(events)
+                self.logger.info(f"Processing {event_count} events from room timeline")
                 message_events = 0
-                event_types = {}
                 
-                for event in room.timeline.events:
+                # The timeline is oldest-first; walk it newest-first so we can
+                # stop at the first event before the cutoff
+                for event in reversed(events):
                     event_type = type(event).__name__
-                    event_types[event_type] = event_types.get(event_type, 0) + 1
+                    event_types[event_type] += 1
+                    
+                    # Every event type counts towards the cutoff, not just
+                    # messages, so older non-text events also end the walk
+                    if since_ms is not None and event.server_timestamp < since_ms:
+                        break
                     
                     # Check for RoomMessageText events specifically
                     if isinstance(event, RoomMessageText):
                         message_events += 1
                         
-                        event_time = datetime.fromtimestamp(event.server_timestamp / 1000)
-                        
-                        if since and event_time < since:
-                            continue
+                        event_time = datetime.fromtimestamp(event.server_timestamp / 1000, tz=timezone.utc)
                         
                         # Determine if this message is newsworthy
+                        event_id = event.event_id
                         is_newsworthy = self._is_newsworthy_message(event.body, event.sender)
                         
-                        activity = self._create_activity(
-                            source_id=f"matrix_{event.event_id}",
+                        yield self._create_activity(
+                            source_id=f"matrix_{event_id}",
                             title=f"Matrix message from {event.sender}",
                             content=event.body,
                             created_at=event_time,
-                            url=f"https://matrix.to/#/{settings.matrix_room_id}/{event.event_id}",
+                            url=room_url_prefix + event_id,
                             author=event.sender,
                             extra_data={
-                                "room_id": settings.matrix_room_id,
-                                "event_id": event.event_id,
+                                "room_id": room_id,
+                                "event_id": event_id,
                                 "event_type": event_type,
                             },
                             is_newsworthy=is_newsworthy,
                         )
-                        activities.append(activity)
                 
-                self.logger.info(f"Timeline event types found: {event_types}")
-                self.logger.info(f"Found {message_events} message events out of {len(room.timeline.events)} total events")
+                self.logger.info(f"Timeline event types found: {dict(event_types)}")
+                self.logger.info(f"Found {message_events} message events out of {event_count} total events")
             else:
                 self.logger.warning("Room has no timeline events available")
                 
-                # Fallback: try room_messages API with more messages
+                # Fallback: page back through the room history with the
+                # room_messages API until we reach the cutoff
                 self.logger.info("Trying room_messages API as fallback...")
-                response = await self.client.room_messages(
-                    room_id=settings.matrix_room_id,
-                    start="",
-                    limit=500,  # Try more messages
-                    direction="b"
-                )
+                message_events = 0
+                total_events = 0
+                token = ""
+                reached_cutoff = False
                 
-                if hasattr(response, 'chunk'):
-                    self.logger.info(f"Processing {len(response.chunk)} events from room_messages API")
-                    message_events = 0
-                    event_types = {}
+                while not reached_cutoff and (since_ms is not None or total_events < MAX_HISTORY_EVENTS):
+                    response = await self.client.room_messages(
+                        room_id=room_id,
+                        start=token,
+                        limit=MESSAGES_PAGE_SIZE,
+                        direction="b",
+                        message_filter=MESSAGE_FILTER,
+                    )
+                    
+                    if not hasattr(response, 'chunk'):
+                        self.logger.warning(f"room_messages request failed: {response}")
+                        break
                     
-                    for event in response.chunk:
+                    events = response.chunk
+                    event_count = len(events)
+                    self.logger.info(f"Processing {event_count} events from room_messages API")
+                    total_events += event_count
+                    
+                    for event in events:
                         event_type = type(event).__name__
-                        event_types[event_type] = event_types.get(event_type, 0) + 1
+                        event_types[event_type] += 1
+                        
+                        # Events are returned newest-first, so the rest are
+                        # older; check every type so non-text events stop paging
+                        if since_ms is not None and event.server_timestamp < since_ms:
+                            reached_cutoff = True
+                            break
                         
                         if isinstance(event, RoomMessageText):
                             message_events += 1
                             
-                            if hasattr(event, 'server_timestamp') and hasattr(event, 'body'):
-                                event_time = datetime.fromtimestamp(event.server_timestamp / 1000)
-                                
-                                if since and event_time < since:
-                                    continue
-                                
-                                is_newsworthy = self._is_newsworthy_message(event.body, event.sender)
-                                
-                                activity = self._create_activity(
-                                    source_id=f"matrix_{event.event_id}",
-                                    title=f"Matrix message from {event.sender}",
-                                    content=event.body,
-                                    created_at=event_time,
-                                    url=f"https://matrix.to/#/{settings.matrix_room_id}/{event.event_id}",
-                                    author=event.sender,
-                                    extra_data={
-                                        "room_id": settings.matrix_room_id,
-                                        "event_id": event.event_id,
-                                        "event_type": event_type,
-                                    },
-                                    is_newsworthy=is_newsworthy,
-                                )
-                                activities.append(activity)
+                            event_time = datetime.fromtimestamp(event.server_timestamp / 1000, tz=timezone.utc)
+                            
+                            event_id = event.event_id
+                            is_newsworthy = self._is_newsworthy_message(event.body, event.sender)
+                            
+                            yield self._create_activity(
+                                source_id=f"matrix_{event_id}",
+                                title=f"Matrix message from {event.sender}",
+                                content=event.body,
+                                created_at=event_time,
+                                url=room_url_prefix + event_id,
+                                author=event.sender,
+                                extra_data={
+                                    "room_id": room_id,
+                                    "event_id": event_id,
+                                    "event_type": event_type,
+                                },
+                                is_newsworthy=is_newsworthy,
+                            )
                     
-                    self.logger.info(f"API event types found: {event_types}")
-                    self.logger.info(f"Found {message_events} message events out of {len(response.chunk)} total events")
+                    # No more history (or no progress) means we're done
+                    if not events or not response.end or response.end == token:
+                        break
+                    token = response.end
+                
+                self.logger.info(f"API event types found: {dict(event_types)}")
+                self.logger.info(f"Found {message_events} message events out of {total_events} total events")
             
         except Exception as e:
             self.logger.error(f"Error collecting Matrix messages: {e}")
         finally:
             await self.client.close()
-            
-        return activities
 
     def _is_newsworthy_message(self, content: str, sender: str) -> bool:
         """Determine if a Matrix message is newsworthy.
@@ -205,30 +305,15 @@ class MatrixCollector(BaseCollector):
         Returns:
             True if the message is considered newsworthy
         """
-        content_lower = content.lower()
-        
         # Messages from the configured user are always newsworthy
         if sender == self.user_id:
             return True
         
-        # Messages about new members, releases, or important updates
-        newsworthy_keywords = [
-            "new member",
-            "welcome",
-            "release",
-            "update",
-            "announcement",
-            "important",
-            "breaking",
-            "feature",
-            "bug fix",
-            "milestone",
-            "version",
-            "launch",
-            "deployed",
-        ]
-        
-        return any(keyword in content_lower for keyword in newsworthy_keywords)
+        return _has_newsworthy_keywords(content)
+
+    async def aclose(self) -> None:
+        """Close the Matrix client session."""
+        await self.client.close()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -236,4 +321,4 @@ class MatrixCollector(BaseCollector):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.client.close()
+        await self.aclose()
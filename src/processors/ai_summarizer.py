@@ -1,13 +1,21 @@
 """AI-powered content summarization using Claude."""
 
+import asyncio
+import hashlib
+import io
+from collections import defaultdict
 from datetime import datetime
-from typing import List
+from itertools import islice
+from typing import DefaultDict, List, Optional
 
-from anthropic import Anthropic
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 
-from config.settings import settings
-from src.storage import Activity
+from config.settings import get_settings
+from src.storage import Activity, Summary, get_db_session
 
 
 class AISummarizer:
@@ -15,9 +23,20 @@ class AISummarizer:
 
     def __init__(self) -> None:
         """Initialize the AI summarizer."""
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        # One pooled HTTP client for all requests, so repeated summaries reuse
+        # the TLS connection instead of handshaking each time
+        self.client = AsyncAnthropic(
+            api_key=get_settings().anthropic_api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            ),
+        )
         self.logger = logger.bind(component="AISummarizer")
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.close()
+
     async def generate_weekly_summary(
         self, activities: List[Activity], week_start: datetime, week_end: datetime
     ) -> str:
@@ -41,19 +60,13 @@ class AISummarizer:
         prompt = self._create_weekly_summary_prompt(activity_data, week_start, week_end)
         
         try:
-            response = self.client.messages.create(
+            summary = await self._complete(
+                "weekly",
+                prompt,
                 model="claude-3-sonnet-20240229",
                 max_tokens=2000,
                 temperature=0.7,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
             )
-            
-            summary = response.content[0].text
             self.logger.info(f"Generated weekly summary ({len(summary)} characters)")
             return summary
             
@@ -62,25 +75,109 @@ class AISummarizer:
             # Fallback to basic summary
             return self._generate_fallback_summary(activities, week_start, week_end)
 
-    def _prepare_activity_data(self, activities: List[Activity]) -> str:
-        """Prepare activity data for the AI prompt."""
-        activity_lines = []
+    async def _complete(
+        self,
+        kind: str,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        activity_id: Optional[int] = None,
+    ) -> str:
+        """Get a completion for a prompt, reusing a stored one if available.
         
-        for activity in activities:
-            activity_info = [
-                f"Type: {activity.activity_type.value}",
-                f"Title: {activity.title}",
-                f"Content: {activity.content[:200]}...",
-                f"Author: {activity.author or 'Unknown'}",
-                f"Date: {activity.created_at.strftime('%Y-%m-%d %H:%M')}",
-            ]
+        Retries and cross-posting ask for the same summaries again, so
+        completions are cached in the database by a hash of model and prompt.
+        
+        Args:
+            kind: Kind of summary, e.g. "weekly" or "social"
+            prompt: Prompt to send
+            model: Claude model to use
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            activity_id: Activity being summarized, if any
             
+        Returns:
+            The completion text
+        """
+        content_hash = hashlib.blake2b(
+            f"{model}\n{prompt}".encode(), digest_size=16
+        ).hexdigest()
+        
+        # The database driver is blocking, so cache round-trips run in a
+        # worker thread to keep concurrent summaries and collectors moving
+        cached = await asyncio.to_thread(self._get_cached_summary, kind, content_hash)
+        if cached is not None:
+            self.logger.debug(f"Using cached {kind} summary {content_hash}")
+            return cached
+        
+        response = await self.client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        )
+        text = response.content[0].text
+        
+        await asyncio.to_thread(
+            self._store_summary, kind, content_hash, text, activity_id
+        )
+        return text
+
+    def _get_cached_summary(self, kind: str, content_hash: str) -> Optional[str]:
+        """Look up a cached summary, treating cache errors as a miss."""
+        try:
+            with get_db_session() as session:
+                return session.scalar(
+                    select(Summary.text).where(
+                        Summary.kind == kind, Summary.content_hash == content_hash
+                    )
+                )
+        except Exception as e:
+            self.logger.warning(f"Summary cache lookup failed: {e}")
+            return None
+
+    def _store_summary(
+        self, kind: str, content_hash: str, text: str, activity_id: Optional[int]
+    ) -> None:
+        """Store a generated summary, ignoring cache errors."""
+        try:
+            with get_db_session() as session:
+                session.execute(
+                    insert(Summary)
+                    .values(
+                        kind=kind,
+                        content_hash=content_hash,
+                        text=text,
+                        activity_id=activity_id,
+                    )
+                    .on_conflict_do_nothing(constraint="unique_summary")
+                )
+        except Exception as e:
+            self.logger.warning(f"Failed to cache {kind} summary: {e}")
+
+    def _prepare_activity_data(self, activities: List[Activity]) -> str:
+        """Prepare activity data for the AI prompt, one line per activity."""
+        buffer = io.StringIO()
+        
+        for index, activity in enumerate(activities):
+            if index:
+                buffer.write("\n")
+            buffer.write(f"Type: {activity.activity_type.value} | Title: {activity.title} | Content: ")
+            buffer.write(activity.content[:200])
+            buffer.write(
+                f"... | Author: {activity.author or 'Unknown'}"
+                f" | Date: {activity.created_at.strftime('%Y-%m-%d %H:%M')}"
+            )
             if activity.url:
-                activity_info.append(f"URL: {activity.url}")
-                
-            activity_lines.append(" | ".join(activity_info))
+                buffer.write(f" | URL: {activity.url}")
         
-        return "\n".join(activity_lines)
+        return buffer.getvalue()
 
     def _create_weekly_summary_prompt(
         self, activity_data: str, week_start: datetime, week_end: datetime
@@ -148,12 +245,9 @@ Stay tuned for upcoming developments and consider contributing to the project if
         ]
         
         # Group activities by type
-        activity_groups = {}
+        activity_groups: DefaultDict[str, List[Activity]] = defaultdict(list)
         for activity in activities:
-            activity_type = activity.activity_type.value
-            if activity_type not in activity_groups:
-                activity_groups[activity_type] = []
-            activity_groups[activity_type].append(activity)
+            activity_groups[activity.activity_type.value].append(activity)
         
         # Add each group
         for activity_type, group_activities in activity_groups.items():
@@ -161,7 +255,7 @@ Stay tuned for upcoming developments and consider contributing to the project if
             content_parts.append(f"## {type_name}")
             content_parts.append("")
             
-            for activity in group_activities[:5]:  # Limit to 5 per group
+            for activity in islice(group_activities, 5):  # Limit to 5 per group
                 content_parts.append(f"- {activity.title}")
                 if activity.url:
                     content_parts.append(f"  - [View details]({activity.url})")
@@ -202,19 +296,15 @@ Make it informative but brief, suitable for Twitter/X or Mastodon. Focus on the
 """
         
         try:
-            response = self.client.messages.create(
+            summary = await self._complete(
+                "social",
+                prompt,
                 model="claude-3-haiku-20240307",  # Faster model for simple tasks
                 max_tokens=100,
                 temperature=0.5,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+                activity_id=activity.id,
             )
-            
-            summary = response.content[0].text.strip()
+            summary = summary.strip()
             self.logger.debug(f"Generated social summary: {summary}")
             return summary
             
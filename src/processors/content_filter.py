@@ -1,13 +1,23 @@
 """Content filtering for determining newsworthy activities."""
 
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from loguru import logger
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, insert
 
-from config.settings import settings
-from src.storage import Activity, Platform, Post, get_db_session
+from config.settings import get_settings
+from src.storage import Activity, ActivityType, Platform, Post, get_db_session
+
+# Base priority of each activity type (higher number = higher priority)
+_PRIORITY = {
+    ActivityType.GITHUB_RELEASE: 10,
+    ActivityType.MWMBL_STATS: 8,
+    ActivityType.MATRIX_POST: 7,
+    ActivityType.GITHUB_PR: 6,
+    ActivityType.GITHUB_ISSUE: 4,
+    ActivityType.GITHUB_COMMIT: 2,
+}
 
 
 class ContentFilter:
@@ -29,72 +39,112 @@ class ContentFilter:
         Returns:
             List of newsworthy activities ready for posting
         """
+        return self.get_newsworthy_activities_by_platform(since, [platform])[platform]
+
+    def get_newsworthy_activities_by_platform(
+        self, since: datetime, platforms: Sequence[Platform]
+    ) -> Dict[Platform, List[Activity]]:
+        """Get newsworthy activities that haven't been posted, for several platforms.
+        
+        The candidates are the same for every platform apart from where they
+        were already posted, so they are fetched once and bucketed here.
+        
+        Args:
+            since: Get activities created after this datetime
+            platforms: The platforms to check for existing posts
+            
+        Returns:
+            Dictionary mapping each platform to its activities ready for posting
+        """
+        by_platform: Dict[Platform, List[Activity]] = {
+            platform: [] for platform in platforms
+        }
+
         with get_db_session() as session:
-            # Get activities that are newsworthy and haven't been posted to this platform
-            activities = (
-                session.query(Activity)
+            # Check when we last posted to each platform; there's no point
+            # fetching candidates for platforms that are cooling down
+            last_posted = dict(
+                session.query(Post.platform, func.max(Post.posted_at))
+                .filter(Post.platform.in_(platforms))
+                .group_by(Post.platform)
+                .all()
+            )
+            ready = [
+                platform
+                for platform in platforms
+                if not self._in_cooldown(last_posted.get(platform), platform)
+            ]
+            if not ready:
+                return by_platform
+
+            # Get newsworthy activities along with each platform they've already
+            # been posted to (one row per post, or a single row with None)
+            rows = (
+                session.query(Activity, Post.platform)
+                .outerjoin(
+                    Post,
+                    and_(Post.activity_id == Activity.id, Post.platform.in_(ready)),
+                )
                 .filter(
                     and_(
                         Activity.is_newsworthy == True,
                         Activity.created_at >= since,
-                        ~Activity.id.in_(
-                            session.query(Post.activity_id)
-                            .filter(Post.platform == platform)
-                            .filter(Post.activity_id.isnot(None))
-                        ),
                     )
                 )
-                .order_by(Activity.created_at.desc())
-                .limit(settings.max_daily_posts)
+                .order_by(Activity.created_at.desc(), Activity.id)
                 .all()
             )
 
-            # Apply additional filtering based on posting frequency
-            filtered_activities = self._apply_frequency_filter(activities, platform)
+            posted_to: Dict[int, set] = {}
+            candidates: List[Activity] = []
+            for activity, posted_platform in rows:
+                if activity.id not in posted_to:
+                    posted_to[activity.id] = set()
+                    candidates.append(activity)
+                if posted_platform is not None:
+                    posted_to[activity.id].add(posted_platform)
 
-            self.logger.info(
-                f"Found {len(filtered_activities)} newsworthy activities for {platform}"
-            )
-            return filtered_activities
+            max_daily_posts = get_settings().max_daily_posts
+            for platform in ready:
+                # Take the most recent unposted activities, then prioritize
+                # them by type and recency
+                unposted = [
+                    activity
+                    for activity in candidates
+                    if platform not in posted_to[activity.id]
+                ]
+                by_platform[platform] = self._prioritize_activities(
+                    unposted[:max_daily_posts]
+                )
 
-    def _apply_frequency_filter(
-        self, activities: List[Activity], platform: Platform
-    ) -> List[Activity]:
-        """Apply frequency-based filtering to avoid spam.
+                self.logger.info(
+                    f"Found {len(by_platform[platform])} newsworthy activities for {platform}"
+                )
+
+            return by_platform
+
+    def _in_cooldown(self, last_posted_at: Optional[datetime], platform: Platform) -> bool:
+        """Check whether the platform was posted to too recently.
         
         Args:
-            activities: List of activities to filter
+            last_posted_at: When we last posted to the platform, if ever
             platform: The platform being posted to
             
         Returns:
-            Filtered list of activities
+            True if posting should be skipped to avoid spam
         """
-        if not activities:
-            return activities
-
-        with get_db_session() as session:
-            # Check when we last posted to this platform
-            last_post = (
-                session.query(Post)
-                .filter(Post.platform == platform)
-                .order_by(Post.posted_at.desc())
-                .first()
-            )
-
-            if last_post:
-                time_since_last_post = datetime.now() - last_post.posted_at
-                min_interval = timedelta(hours=settings.min_post_interval_hours)
-
-                if time_since_last_post < min_interval:
-                    self.logger.info(
-                        f"Skipping posts to {platform} - last post was {time_since_last_post} ago"
-                    )
-                    return []
+        if last_posted_at is None:
+            return False
 
-            # Prioritize activities by type and recency
-            prioritized_activities = self._prioritize_activities(activities)
+        time_since_last_post = datetime.now(last_posted_at.tzinfo) - last_posted_at
+        min_interval = timedelta(hours=get_settings().min_post_interval_hours)
 
-            return prioritized_activities
+        if time_since_last_post < min_interval:
+            self.logger.info(
+                f"Skipping posts to {platform} - last post was {time_since_last_post} ago"
+            )
+            return True
+        return False
 
     def _prioritize_activities(self, activities: List[Activity]) -> List[Activity]:
         """Prioritize activities based on type and importance.
@@ -105,31 +155,27 @@ class ContentFilter:
         Returns:
             Prioritized list of activities
         """
-        # Define priority order (higher number = higher priority)
-        priority_map = {
-            "github_release": 10,
-            "mwmbl_stats": 8,
-            "matrix_post": 7,
-            "github_pr": 6,
-            "github_issue": 4,
-            "github_commit": 2,
-        }
+        # created_at is stored as timestamptz, so compare against aware UTC
+        now = datetime.now(timezone.utc)
 
-        def get_priority(activity: Activity) -> int:
-            base_priority = priority_map.get(activity.activity_type.value, 1)
+        def get_priority(activity: Activity) -> float:
+            base_priority = _PRIORITY.get(activity.activity_type, 1)
             
             # Boost priority for recent activities
-            hours_old = (datetime.now() - activity.created_at).total_seconds() / 3600
+            hours_old = (now - activity.created_at).total_seconds() / 3600
             recency_boost = max(0, 5 - hours_old)  # Up to 5 point boost for very recent
             
             return base_priority + recency_boost
 
-        # Sort by priority (highest first)
-        sorted_activities = sorted(activities, key=get_priority, reverse=True)
+        # Score each activity once, then sort by priority (highest first)
+        scored = [(get_priority(activity), activity) for activity in activities]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        sorted_activities = [activity for _, activity in scored]
 
-        self.logger.debug(
-            f"Prioritized {len(sorted_activities)} activities: "
-            f"{[f'{a.activity_type.value}({get_priority(a):.1f})' for a in sorted_activities[:5]]}"
+        self.logger.opt(lazy=True).debug(
+            "Prioritized {} activities: {}",
+            lambda: len(scored),
+            lambda: [f"{a.activity_type.value}({score:.1f})" for score, a in scored[:5]],
         )
 
         return sorted_activities
@@ -175,16 +221,38 @@ class ContentFilter:
             platform: The platform it was posted to
             platform_post_id: Optional ID from the platform
         """
+        self.mark_activities_as_posted([(activity, platform_post_id)], platform)
+
+    def mark_activities_as_posted(
+        self,
+        posted: Sequence[Tuple[Activity, Optional[str]]],
+        platform: Platform,
+    ) -> None:
+        """Mark several activities as posted to a platform in one transaction.
+        
+        Args:
+            posted: Pairs of activity and the optional ID from the platform
+            platform: The platform they were posted to
+        """
+        if not posted:
+            return
+
         with get_db_session() as session:
-            post = Post(
-                activity_id=activity.id,
-                platform=platform,
-                platform_post_id=platform_post_id,
-                content=activity.content[:1000],  # Truncate for storage
+            # One multi-row insert; the Post objects aren't needed afterwards
+            session.execute(
+                insert(Post),
+                [
+                    {
+                        "activity_id": activity.id,
+                        "platform": platform,
+                        "platform_post_id": platform_post_id,
+                        "content": activity.content[:1000],  # Truncate for storage
+                    }
+                    for activity, platform_post_id in posted
+                ],
             )
-            session.add(post)
             session.commit()
 
             self.logger.debug(
-                f"Marked activity {activity.id} as posted to {platform}"
+                f"Marked {len(posted)} activities as posted to {platform}"
             )
@@ -1,25 +1,72 @@
 """Content formatting for different platforms."""
 
 import re
-from typing import Dict, List
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import DefaultDict, Dict, List, Optional, Tuple
 
 from loguru import logger
 
-from src.storage import Activity, Platform
+from src.storage import Activity, ActivityType, Platform
+
+# Patterns used to clean up titles for display
+_WHITESPACE_RE = re.compile(r"\s+")
+_MARKDOWN_RE = re.compile(r"[*_`]")
+_TITLE_PREFIX_RE = re.compile(r"^(PR #\d+:|Issue #\d+:|Commit:)\s*")
+
+# Emoji shown in front of each type of activity
+_EMOJI_MAP = {
+    ActivityType.MATRIX_POST: "💬",
+    ActivityType.GITHUB_PR: "🔀",
+    ActivityType.GITHUB_ISSUE: "🐛",
+    ActivityType.GITHUB_COMMIT: "📝",
+    ActivityType.GITHUB_RELEASE: "🚀",
+    ActivityType.MWMBL_STATS: "📊",
+}
+
+# Activity-type specific hashtags
+_TYPE_HASHTAGS = {
+    ActivityType.MATRIX_POST: ("#community",),
+    ActivityType.GITHUB_PR: ("#development", "#pullrequest"),
+    ActivityType.GITHUB_ISSUE: ("#development", "#issue"),
+    ActivityType.GITHUB_COMMIT: ("#development", "#commit"),
+    ActivityType.GITHUB_RELEASE: ("#release", "#update"),
+    ActivityType.MWMBL_STATS: ("#stats", "#data"),
+}
+
+
+@lru_cache(maxsize=64)
+def _hashtags_for(activity_type: ActivityType, max_tags: int) -> Tuple[str, ...]:
+    """Build the hashtags for a type of activity, at most ``max_tags`` of them."""
+    hashtags = (
+        "#mwmbl",
+        *_TYPE_HASHTAGS.get(activity_type, ()),
+        "#searchengine",
+        "#opensource",
+    )
+    return hashtags[:max_tags]
 
 
 class ContentFormatter:
     """Formats content for different social media platforms."""
 
+    # Platform-specific character limits
+    LIMITS: Dict[Platform, Optional[int]] = {
+        Platform.MASTODON: 500,
+        Platform.X: 280,
+        Platform.BLOG: None,  # No limit for blog posts
+    }
+
     def __init__(self) -> None:
         """Initialize the content formatter."""
         self.logger = logger.bind(component="ContentFormatter")
 
-        # Platform-specific character limits
-        self.limits = {
-            Platform.MASTODON: 500,
-            Platform.X: 280,
-            Platform.BLOG: None,  # No limit for blog posts
+        # Formatter for each platform
+        self._formatters = {
+            Platform.BLOG: self._format_for_blog,
+            Platform.MASTODON: self._format_for_mastodon,
+            Platform.X: self._format_for_x,
         }
 
     def format_activity(self, activity: Activity, platform: Platform) -> str:
@@ -32,73 +79,62 @@ class ContentFormatter:
         Returns:
             Formatted content string
         """
-        if platform == Platform.BLOG:
-            return self._format_for_blog(activity)
-        elif platform == Platform.MASTODON:
-            return self._format_for_mastodon(activity)
-        elif platform == Platform.X:
-            return self._format_for_x(activity)
-        else:
-            return self._format_generic(activity)
+        return self._formatters.get(platform, self._format_generic)(activity)
 
     def _format_for_mastodon(self, activity: Activity) -> str:
         """Format content for Mastodon."""
-        content_parts = []
-        
-        # Add emoji based on activity type
+        # Emoji based on activity type, then the title
         emoji = self._get_activity_emoji(activity)
-        if emoji:
-            content_parts.append(emoji)
-        
-        # Add title
         title = self._clean_title(activity.title)
-        content_parts.append(title)
+        content = f"{emoji} {title}" if emoji else title
         
         # Add URL if available
         if activity.url:
-            content_parts.append(f"\n🔗 {activity.url}")
+            content += f"\n🔗 {activity.url}"
         
         # Add hashtags
         hashtags = self._get_hashtags(activity)
         if hashtags:
-            content_parts.append(f"\n{' '.join(hashtags)}")
-        
-        content = " ".join(content_parts)
+            content += "\n" + " ".join(hashtags)
         
         # Truncate if necessary
-        return self._truncate_content(content, self.limits[Platform.MASTODON])
+        return self._truncate_content(content, self.LIMITS[Platform.MASTODON])
 
     def _format_for_x(self, activity: Activity) -> str:
         """Format content for X/Twitter."""
-        content_parts = []
-        
-        # Add emoji
+        # Emoji, then the shortened title
         emoji = self._get_activity_emoji(activity)
-        if emoji:
-            content_parts.append(emoji)
-        
-        # Add shortened title
         title = self._clean_title(activity.title)
-        content_parts.append(title)
+        content = f"{emoji} {title}" if emoji else title
         
         # Add URL if available (X auto-shortens URLs)
         if activity.url:
-            content_parts.append(activity.url)
+            content += f" {activity.url}"
         
         # Add hashtags (fewer for X due to character limit)
         hashtags = self._get_hashtags(activity, max_tags=2)
         if hashtags:
-            content_parts.append(" ".join(hashtags))
-        
-        content = " ".join(content_parts)
+            content += " " + " ".join(hashtags)
         
         # Truncate if necessary
-        return self._truncate_content(content, self.limits[Platform.X])
+        return self._truncate_content(content, self.LIMITS[Platform.X])
 
     def _format_for_blog(self, activity: Activity) -> str:
         """Format content for blog posts (markdown)."""
         content_parts = []
+        self._append_blog_parts(activity, content_parts)
+        return "\n\n".join(content_parts)
+
+    def _append_blog_parts(self, activity: Activity, content_parts: List[str]) -> None:
+        """Append the markdown paragraphs for an activity's blog entry.
+        
+        The paragraphs are meant to be joined with blank lines, so several
+        activities can share one list and a single join.
         
+        Args:
+            activity: The activity to format
+            content_parts: List to append the paragraphs to
+        """
         # Add title as markdown header
         title = self._clean_title(activity.title)
         content_parts.append(f"### {title}")
@@ -114,8 +150,6 @@ class ContentFormatter:
         # Add URL as markdown link
         if activity.url:
             content_parts.append(f"[View on {self._get_platform_name(activity)}]({activity.url})")
-        
-        return "\n\n".join(content_parts)
 
     def _format_generic(self, activity: Activity) -> str:
         """Generic formatting fallback."""
@@ -123,58 +157,33 @@ class ContentFormatter:
 
     def _get_activity_emoji(self, activity: Activity) -> str:
         """Get appropriate emoji for activity type."""
-        emoji_map = {
-            "matrix_post": "💬",
-            "github_pr": "🔀",
-            "github_issue": "🐛",
-            "github_commit": "📝",
-            "github_release": "🚀",
-            "mwmbl_stats": "📊",
-        }
-        return emoji_map.get(activity.activity_type.value, "📢")
+        return _EMOJI_MAP.get(activity.activity_type, "📢")
 
-    def _get_hashtags(self, activity: Activity, max_tags: int = 5) -> List[str]:
+    def _get_hashtags(self, activity: Activity, max_tags: int = 5) -> Tuple[str, ...]:
         """Generate relevant hashtags for an activity."""
-        hashtags = ["#mwmbl"]
-        
-        # Add activity-type specific hashtags
-        type_hashtags = {
-            "matrix_post": ["#community"],
-            "github_pr": ["#development", "#pullrequest"],
-            "github_issue": ["#development", "#issue"],
-            "github_commit": ["#development", "#commit"],
-            "github_release": ["#release", "#update"],
-            "mwmbl_stats": ["#stats", "#data"],
-        }
-        
-        activity_tags = type_hashtags.get(activity.activity_type.value, [])
-        hashtags.extend(activity_tags)
-        
-        # Add search engine related tags
-        hashtags.extend(["#searchengine", "#opensource"])
-        
-        return hashtags[:max_tags]
+        return _hashtags_for(activity.activity_type, max_tags)
 
     def _clean_title(self, title: str) -> str:
         """Clean and normalize title text."""
         # Remove excessive whitespace
-        title = re.sub(r'\s+', ' ', title.strip())
+        title = _WHITESPACE_RE.sub(" ", title.strip())
         
         # Remove markdown formatting
-        title = re.sub(r'[*_`]', '', title)
+        title = _MARKDOWN_RE.sub("", title)
         
         # Remove issue/PR prefixes for cleaner display
-        title = re.sub(r'^(PR #\d+:|Issue #\d+:|Commit:)\s*', '', title)
+        title = _TITLE_PREFIX_RE.sub("", title)
         
         return title
 
     def _get_platform_name(self, activity: Activity) -> str:
         """Get human-readable platform name from activity."""
-        if "github" in activity.activity_type.value:
+        activity_type = activity.activity_type.value
+        if "github" in activity_type:
             return "GitHub"
-        elif "matrix" in activity.activity_type.value:
+        elif "matrix" in activity_type:
             return "Matrix"
-        elif "mwmbl" in activity.activity_type.value:
+        elif "mwmbl" in activity_type:
             return "Mwmbl"
         else:
             return "Source"
@@ -184,14 +193,41 @@ class ContentFormatter:
         if not max_length or len(content) <= max_length:
             return content
         
-        # Try to truncate at word boundary
-        truncated = content[:max_length - 3]
-        last_space = truncated.rfind(' ')
+        # Try to truncate at word boundary, searching the original string so
+        # only the final slice is copied
+        cut = max_length - 3
+        last_space = content.rfind(' ', 0, cut)
         
         if last_space > max_length * 0.8:  # If we can save most of the content
-            truncated = truncated[:last_space]
+            cut = last_space
+        
+        return content[:cut] + "..."
+
+    def format_weekly_minimal(
+        self, activities: List[Activity], week_start: datetime, week_end: datetime
+    ) -> str:
+        """Format a complete weekly blog post from a template, without AI.
         
-        return truncated + "..."
+        Used for quiet weeks, where there is too little to be worth an
+        AI-written summary.
+        
+        Args:
+            activities: List of activities from the week
+            week_start: Start of the week
+            week_end: End of the week
+            
+        Returns:
+            Formatted markdown content for blog post, title first
+        """
+        return "\n\n".join([
+            f"# Weekly Update: {week_start.strftime('%B %d')} - {week_end.strftime('%B %d, %Y')}",
+            f"A quieter week for Mwmbl, with {len(activities)} "
+            f"{'activity' if len(activities) == 1 else 'activities'} across the project:",
+            self.format_weekly_summary(activities),
+            "---",
+            "*Want to get involved? Check out our [GitHub repositories](https://github.com/mwmbl) "
+            "or join our [Matrix community](https://matrix.to/#/#mwmbl:matrix.org)!*",
+        ])
 
     def format_weekly_summary(self, activities: List[Activity]) -> str:
         """Format a weekly summary of activities for blog post.
@@ -206,12 +242,9 @@ class ContentFormatter:
             return "No significant activities this week."
         
         # Group activities by type
-        grouped_activities = {}
+        grouped_activities: DefaultDict[str, List[Activity]] = defaultdict(list)
         for activity in activities:
-            activity_type = activity.activity_type.value
-            if activity_type not in grouped_activities:
-                grouped_activities[activity_type] = []
-            grouped_activities[activity_type].append(activity)
+            grouped_activities[activity.activity_type.value].append(activity)
         
         content_parts = []
         
@@ -230,9 +263,10 @@ class ContentFormatter:
                 activities_of_type = grouped_activities[activity_type]
                 content_parts.append(f"## {section_title}")
                 
+                # Entries are joined with blank lines like their paragraphs,
+                # so they go straight into the summary's list
                 for activity in activities_of_type[:10]:  # Limit to 10 per section
-                    formatted_activity = self._format_for_blog(activity)
-                    content_parts.append(formatted_activity)
+                    self._append_blog_parts(activity, content_parts)
                 
                 if len(activities_of_type) > 10:
                     content_parts.append(f"*...and {len(activities_of_type) - 10} more*")
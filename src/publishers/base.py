@@ -1,16 +1,23 @@
 """Base publisher class for all platform publishers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 from loguru import logger
 
 from src.storage import Activity, Platform
 
+# Markdown characters dropped from a summary's heading to make its title
+_TITLE_STRIP = str.maketrans("", "", "#*_`")
+
 
 class BasePublisher(ABC):
     """Base class for all platform publishers."""
 
+    # Most publishes sent at once by publish_activities
+    max_concurrent_publishes = 5
+
     def __init__(self, platform: Platform) -> None:
         """Initialize the publisher.
         
@@ -33,6 +40,40 @@ class BasePublisher(ABC):
         """
         pass
 
+    async def publish_activities(
+        self, items: Sequence[Tuple[Activity, str]]
+    ) -> List[Optional[str]]:
+        """Publish several activities to the platform.
+        
+        The default publishes them concurrently, a few at a time; platforms
+        with a cheaper way to publish in bulk override this.
+        
+        Args:
+            items: Pairs of activity and its formatted content
+            
+        Returns:
+            Platform-specific post ID for each item, or None where it failed
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_publishes)
+
+        async def publish(activity: Activity, content: str) -> Optional[str]:
+            async with semaphore:
+                return await self.publish_activity(activity, content)
+
+        results = await asyncio.gather(
+            *(publish(activity, content) for activity, content in items),
+            return_exceptions=True,
+        )
+
+        post_ids = []
+        for (activity, _), result in zip(items, results):
+            if isinstance(result, Exception):
+                self._handle_publish_error(result, f"publishing activity {activity.id}")
+                post_ids.append(None)
+            else:
+                post_ids.append(result)
+        return post_ids
+
     @abstractmethod
     async def publish_weekly_summary(
         self, content: str, week_start_str: str, week_end_str: str
@@ -66,6 +107,22 @@ class BasePublisher(ABC):
         """Platform-specific connection test implementation."""
         pass
 
+    def _summary_title(self, first_line: str, week_start_str: str, week_end_str: str) -> str:
+        """Turn the first line of a weekly summary into a plain-text title.
+        
+        Args:
+            first_line: First line of the summary, usually a markdown heading
+            week_start_str: Week start date as string
+            week_end_str: Week end date as string
+            
+        Returns:
+            The title, or a generic one if the line is blank
+        """
+        return (
+            first_line.translate(_TITLE_STRIP).strip()
+            or f"Weekly Update: {week_start_str} - {week_end_str}"
+        )
+
     def _handle_publish_error(self, error: Exception, context: str) -> None:
         """Handle publishing errors with appropriate logging.
         
@@ -1,17 +1,24 @@
 """Blog publisher for posting to GitHub Pages blog."""
 
+import asyncio
 import os
+import re
+import shutil
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from git import Repo
+from git import Actor, Repo
 from loguru import logger
 
-from config.settings import settings
+from config.settings import get_settings
 from src.storage import Activity, Platform
 
 from .base import BasePublisher
 
+# Runs of characters that can't appear in a post filename
+_UNSAFE_FILENAME_RE = re.compile(r"\W+")
+
 
 class BlogPublisher(BasePublisher):
     """Publisher for GitHub Pages blog."""
@@ -19,8 +26,9 @@ class BlogPublisher(BasePublisher):
     def __init__(self) -> None:
         """Initialize the blog publisher."""
         super().__init__(Platform.BLOG)
-        self.repo_path = settings.blog_repo_path
-        self.repo_url = settings.blog_repo_url
+        self.repo_path = get_settings().blog_repo_path
+        self.repo_url = get_settings().blog_repo_url
+        self.posts_dir = Path(self.repo_path) / "_posts"
 
     async def publish_activity(self, activity: Activity, content: str) -> Optional[str]:
         """Publish an individual activity to the blog.
@@ -36,15 +44,11 @@ class BlogPublisher(BasePublisher):
             Blog post filename if successful, None otherwise
         """
         try:
-            self.logger.info(f"Publishing individual activity to blog: {activity.title}")
-            
-            # Create a filename based on the activity
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            safe_title = self._sanitize_filename(activity.title)
-            filename = f"{date_str}-{safe_title}.md"
+            self.logger.info("Publishing individual activity to blog: {}", activity.title)
             
-            # Create blog post content
-            blog_content = self._create_individual_post(activity, content)
+            filename, blog_content = self._prepare_individual_post(
+                activity, content, datetime.now()
+            )
             
             # Write and commit the post
             success = await self._write_and_commit_post(filename, blog_content, f"Add post: {activity.title}")
@@ -55,6 +59,70 @@ class BlogPublisher(BasePublisher):
             self._handle_publish_error(e, "publishing individual activity to blog")
             return None
 
+    async def publish_activities(
+        self, items: Sequence[Tuple[Activity, str]]
+    ) -> List[Optional[str]]:
+        """Publish several individual activities to the blog in one commit.
+        
+        Each publish would otherwise pull, commit and push on its own, so all
+        the posts are written first and pushed together.
+        
+        Args:
+            items: Pairs of activity and its formatted content
+            
+        Returns:
+            Blog post filename for each item, or None if publishing failed
+        """
+        if len(items) <= 1:
+            return await super().publish_activities(items)
+        
+        try:
+            self.logger.info(f"Publishing {len(items)} individual activities to blog")
+            
+            now = datetime.now()
+            filenames = []
+            posts = {}
+            for activity, content in items:
+                filename, blog_content = self._prepare_individual_post(activity, content, now)
+                if filename in posts:
+                    # Same-day posts can share a (truncated) title, so number
+                    # the later ones rather than overwriting the earlier post
+                    stem = filename.removesuffix(".md")
+                    suffix = 2
+                    while f"{stem}-{suffix}.md" in posts:
+                        suffix += 1
+                    filename = f"{stem}-{suffix}.md"
+                filenames.append(filename)
+                posts[filename] = blog_content
+            
+            success = await self._write_and_commit_posts(posts, f"Add {len(posts)} posts")
+            
+            return filenames if success else [None] * len(items)
+            
+        except Exception as e:
+            self._handle_publish_error(e, "publishing individual activities to blog")
+            return [None] * len(items)
+
+    def _prepare_individual_post(
+        self, activity: Activity, content: str, now: datetime
+    ) -> Tuple[str, str]:
+        """Build the filename and full content of an individual activity's post.
+        
+        Args:
+            activity: The activity
+            content: Formatted content
+            now: Publication time of the post
+            
+        Returns:
+            Tuple of the post filename and its content with front matter
+        """
+        # Create a filename based on the activity
+        date_str = now.strftime("%Y-%m-%d")
+        safe_title = self._sanitize_filename(activity.title)
+        filename = f"{date_str}-{safe_title}.md"
+        
+        return filename, self._create_individual_post(activity, content, now)
+
     async def publish_weekly_summary(
         self, content: str, week_start_str: str, week_end_str: str
     ) -> Optional[str]:
@@ -76,7 +144,9 @@ class BlogPublisher(BasePublisher):
             filename = f"{week_start_date.strftime('%Y-%m-%d')}-weekly-update.md"
             
             # Add Jekyll front matter to the content
-            blog_content = self._add_jekyll_frontmatter(content, week_start_str, week_end_str)
+            blog_content = self._add_jekyll_frontmatter(
+                content, week_start_str, week_end_str, datetime.now()
+            )
             
             # Write and commit the post
             success = await self._write_and_commit_post(
@@ -102,39 +172,60 @@ class BlogPublisher(BasePublisher):
         Returns:
             True if successful, False otherwise
         """
+        return await self._write_and_commit_posts({filename: content}, commit_message)
+
+    async def _write_and_commit_posts(self, posts: Dict[str, str], commit_message: str) -> bool:
+        """Write blog posts and push them to the repository in a single commit.
+        
+        The file and git work is blocking, so it runs in a worker thread to
+        keep the event loop free while the repository is pulled and pushed.
+        
+        Args:
+            posts: Post content keyed by filename
+            commit_message: Git commit message
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await asyncio.to_thread(
+            self._write_and_commit_posts_sync, posts, commit_message
+        )
+
+    def _write_and_commit_posts_sync(self, posts: Dict[str, str], commit_message: str) -> bool:
+        """Blocking implementation of ``_write_and_commit_posts``."""
         try:
             # Clone or update the repository
-            repo = await self._ensure_repo()
+            repo = self._ensure_repo_sync()
             if not repo:
                 return False
             
             # Create the posts directory if it doesn't exist
-            posts_dir = os.path.join(self.repo_path, "_posts")
-            os.makedirs(posts_dir, exist_ok=True)
+            self.posts_dir.mkdir(exist_ok=True)
             
-            # Write the post file
-            post_path = os.path.join(posts_dir, filename)
-            with open(post_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Write the post files
+            post_paths = []
+            for filename, content in posts.items():
+                post_path = self.posts_dir / filename
+                post_path.write_text(content, encoding='utf-8')
+                post_paths.append(str(post_path))
             
-            # Add, commit, and push
-            repo.index.add([post_path])
+            # Add, commit, and push, as the configured blog author
+            repo.index.add(post_paths)
+            author = Actor(get_settings().blog_author_name, get_settings().blog_author_email)
+            commit_date = datetime.now().isoformat()
             repo.index.commit(
                 commit_message,
-                author_date=datetime.now().isoformat(),
-                commit_date=datetime.now().isoformat(),
+                author=author,
+                committer=author,
+                author_date=commit_date,
+                commit_date=commit_date,
             )
             
-            # Configure git user if not already set
-            with repo.config_writer() as git_config:
-                git_config.set_value("user", "name", settings.blog_author_name)
-                git_config.set_value("user", "email", settings.blog_author_email)
-            
             # Push to remote
             origin = repo.remote(name='origin')
             origin.push()
             
-            self.logger.info(f"Successfully published blog post: {filename}")
+            self.logger.info(f"Successfully published blog posts: {', '.join(posts)}")
             return True
             
         except Exception as e:
@@ -147,16 +238,24 @@ class BlogPublisher(BasePublisher):
         Returns:
             Git repository object if successful, None otherwise
         """
+        return await asyncio.to_thread(self._ensure_repo_sync)
+
+    def _ensure_repo_sync(self) -> Optional[Repo]:
+        """Blocking implementation of ``_ensure_repo``."""
         try:
             if os.path.exists(self.repo_path):
-                # Repository exists, pull latest changes
+                # Repository exists, move to the latest remote commit. Only
+                # new posts are ever written, so there's nothing to merge
                 repo = Repo(self.repo_path)
-                origin = repo.remote(name='origin')
-                origin.pull()
+                branch = repo.active_branch.name
+                repo.git.fetch("--depth=1", "origin", branch)
+                repo.git.reset("--hard", f"origin/{branch}")
                 self.logger.debug("Updated existing blog repository")
             else:
-                # Clone the repository
-                repo = Repo.clone_from(self.repo_url, self.repo_path)
+                # Clone only the latest commit; posting doesn't need history
+                repo = Repo.clone_from(
+                    self.repo_url, self.repo_path, depth=1, single_branch=True
+                )
                 self.logger.info(f"Cloned blog repository to {self.repo_path}")
             
             return repo
@@ -165,44 +264,50 @@ class BlogPublisher(BasePublisher):
             self.logger.error(f"Error ensuring blog repository: {e}")
             return None
 
-    def _add_jekyll_frontmatter(self, content: str, week_start_str: str, week_end_str: str) -> str:
+    def _add_jekyll_frontmatter(
+        self, content: str, week_start_str: str, week_end_str: str, now: datetime
+    ) -> str:
         """Add Jekyll front matter to blog content.
         
         Args:
             content: The blog content
             week_start_str: Week start date string
             week_end_str: Week end date string
+            now: Publication time of the post
             
         Returns:
             Content with Jekyll front matter
         """
-        # Extract title from content
-        lines = content.split('\n')
-        title = lines[0].replace('#', '').strip() if lines else f"Weekly Update: {week_start_str} - {week_end_str}"
+        # Extract title from the first line of the content
+        first_line, sep, rest = content.partition('\n')
+        title = self._summary_title(first_line, week_start_str, week_end_str)
         
         # Remove the title from content since it will be in front matter
-        content_without_title = '\n'.join(lines[1:]).strip() if len(lines) > 1 else content
+        content_without_title = rest.strip() if sep else content
         
         # Create front matter
         frontmatter = f"""---
 layout: post
 title: "{title}"
-date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S %z')}
+date: {now.strftime('%Y-%m-%d %H:%M:%S %z')}
 categories: [weekly-update]
 tags: [mwmbl, development, community, stats]
-author: {settings.blog_author_name}
+author: {get_settings().blog_author_name}
 ---
 
 """
         
         return frontmatter + content_without_title
 
-    def _create_individual_post(self, activity: Activity, content: str) -> str:
+    def _create_individual_post(
+        self, activity: Activity, content: str, now: datetime
+    ) -> str:
         """Create a blog post for an individual activity.
         
         Args:
             activity: The activity
             content: Formatted content
+            now: Publication time of the post
             
         Returns:
             Complete blog post content with front matter
@@ -211,10 +316,10 @@ author: {settings.blog_author_name}
         frontmatter = f"""---
 layout: post
 title: "{activity.title}"
-date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S %z')}
+date: {now.strftime('%Y-%m-%d %H:%M:%S %z')}
 categories: [activity]
 tags: [mwmbl, {activity.activity_type.value.replace('_', '-')}]
-author: {activity.author or settings.blog_author_name}
+author: {activity.author or get_settings().blog_author_name}
 ---
 
 """
@@ -230,10 +335,9 @@ author: {activity.author or settings.blog_author_name}
         Returns:
             Sanitized filename
         """
-        # Remove or replace problematic characters
-        sanitized = title.lower()
-        sanitized = ''.join(c if c.isalnum() or c in '-_' else '-' for c in sanitized)
-        sanitized = '-'.join(word for word in sanitized.split('-') if word)  # Remove empty parts
+        # Replace each run of problematic characters (including dashes) with
+        # a single dash, then drop any at the ends
+        sanitized = _UNSAFE_FILENAME_RE.sub("-", title.lower()).strip("-")
         return sanitized[:50]  # Limit length
 
     async def _test_connection_impl(self) -> bool:
@@ -267,8 +371,7 @@ author: {activity.author or settings.blog_author_name}
         """Clean up the local repository directory."""
         try:
             if os.path.exists(self.repo_path):
-                import shutil
-                shutil.rmtree(self.repo_path)
+                await asyncio.to_thread(shutil.rmtree, self.repo_path)
                 self.logger.info("Cleaned up blog repository directory")
         except Exception as e:
             self.logger.error(f"Error cleaning up repository: {e}")
@@ -1,14 +1,27 @@
 """Mastodon publisher for posting to Mastodon instances."""
 
+import asyncio
+from functools import cached_property
 from typing import Optional
 
 from mastodon import Mastodon
 
-from config.settings import settings
+from config.settings import get_settings
 from src.storage import Activity, Platform
 
 from .base import BasePublisher
 
+# Everything in the weekly summary post after its title
+_SUMMARY_BODY = """This week in #mwmbl:
+• Development updates
+• Community activity
+• Statistics & progress
+
+Read the full update on our blog! 👇
+https://mwmbl.github.io/blog/
+
+#opensource #searchengine #community"""
+
 
 class MastodonPublisher(BasePublisher):
     """Publisher for Mastodon social media platform."""
@@ -17,10 +30,19 @@ class MastodonPublisher(BasePublisher):
         """Initialize the Mastodon publisher."""
         super().__init__(Platform.MASTODON)
         self.mastodon = Mastodon(
-            access_token=settings.mastodon_access_token,
-            api_base_url=settings.mastodon_instance_url,
+            access_token=get_settings().mastodon_access_token,
+            api_base_url=get_settings().mastodon_instance_url,
+        )
+        # Instance domain, from the API base URL, used to build post URLs
+        self.instance_domain = (
+            get_settings().mastodon_instance_url.replace("https://", "").replace("http://", "")
         )
 
+    @cached_property
+    def username(self) -> str:
+        """Username of the account we post as, fetched once from the API."""
+        return self.mastodon.me()["username"]
+
     async def publish_activity(self, activity: Activity, content: str) -> Optional[str]:
         """Publish an activity to Mastodon.
         
@@ -32,17 +54,19 @@ class MastodonPublisher(BasePublisher):
             Mastodon post ID if successful, None otherwise
         """
         try:
-            self.logger.info(f"Publishing activity to Mastodon: {activity.title}")
+            self.logger.info("Publishing activity to Mastodon: {}", activity.title)
             
-            # Post to Mastodon
-            status = self.mastodon.status_post(
+            # Post to Mastodon. Mastodon.py is synchronous, so the request
+            # runs in a worker thread to keep the event loop free
+            status = await asyncio.to_thread(
+                self.mastodon.status_post,
                 status=content,
                 visibility="public",
                 language="en",
             )
             
             post_id = str(status["id"])
-            self.logger.info(f"Successfully posted to Mastodon: {post_id}")
+            self.logger.info("Successfully posted to Mastodon: {}", post_id)
             return post_id
             
         except Exception as e:
@@ -68,7 +92,8 @@ class MastodonPublisher(BasePublisher):
             
             self.logger.info(f"Publishing weekly summary to Mastodon")
             
-            status = self.mastodon.status_post(
+            status = await asyncio.to_thread(
+                self.mastodon.status_post,
                 status=summary_content,
                 visibility="public",
                 language="en",
@@ -93,33 +118,21 @@ class MastodonPublisher(BasePublisher):
         Returns:
             Formatted summary for Mastodon
         """
-        # Extract the title from the blog content
-        lines = content.split('\n')
-        title = lines[0].replace('#', '').strip() if lines else f"Weekly Update: {week_start_str} - {week_end_str}"
+        # Extract the title from the first line of the blog content
+        title = self._summary_title(
+            content.partition('\n')[0], week_start_str, week_end_str
+        )
         
         # Create a concise summary
-        summary_parts = [
-            f"📊 {title}",
-            "",
-            "This week in #mwmbl:",
-            "• Development updates",
-            "• Community activity", 
-            "• Statistics & progress",
-            "",
-            "Read the full update on our blog! 👇",
-            "https://mwmbl.github.io/blog/",
-            "",
-            "#opensource #searchengine #community"
-        ]
-        
-        return "\n".join(summary_parts)
+        return f"📊 {title}\n\n{_SUMMARY_BODY}"
 
     async def _test_connection_impl(self) -> bool:
         """Test connection to Mastodon."""
         try:
             # Verify credentials by getting account info
-            account = self.mastodon.me()
-            self.logger.info(f"Connected to Mastodon as @{account['username']}")
+            account = await asyncio.to_thread(self.mastodon.me)
+            self.username = account["username"]
+            self.logger.info(f"Connected to Mastodon as @{self.username}")
             return True
         except Exception as e:
             self.logger.error(f"Mastodon connection test failed: {e}")
@@ -134,6 +147,4 @@ class MastodonPublisher(BasePublisher):
         Returns:
             URL to the post
         """
-        # Extract instance domain from the API base URL
-        instance_domain = settings.mastodon_instance_url.replace("https://", "").replace("http://", "")
-        return f"https://{instance_domain}/@{self.mastodon.me()['username']}/{post_id}"
+        return f"https://{self.instance_domain}/@{self.username}/{post_id}"
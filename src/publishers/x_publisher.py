@@ -1,14 +1,34 @@
 """X (Twitter) publisher for posting to X/Twitter."""
 
+import asyncio
+from functools import cached_property
 from typing import Optional
 
 import tweepy
 
-from config.settings import settings
+from config.settings import get_settings
 from src.storage import Activity, Platform
 
 from .base import BasePublisher
 
+# Weekly summary post, and the shorter fallback for when a long title would
+# take it over the character limit
+_SUMMARY_TEMPLATE = (
+    "📊 {title}\n\n"
+    "This week in #mwmbl: development updates, community activity & progress stats.\n\n"
+    "Read more: https://mwmbl.github.io/blog/\n\n"
+    "#opensource #searchengine"
+)
+_SHORT_SUMMARY_TEMPLATE = (
+    "📊 Weekly #mwmbl update: {week_start}-{week_end}\n\n"
+    "Development & community updates on our blog:\n"
+    "https://mwmbl.github.io/blog/\n\n"
+    "#opensource #searchengine"
+)
+
+# Longest title that fits in the summary template within the character limit
+_MAX_SUMMARY_TITLE_LENGTH = 280 - len(_SUMMARY_TEMPLATE.format(title=""))
+
 
 class XPublisher(BasePublisher):
     """Publisher for X (formerly Twitter) social media platform."""
@@ -19,13 +39,24 @@ class XPublisher(BasePublisher):
         
         # Initialize Tweepy client with API v2
         self.client = tweepy.Client(
-            bearer_token=settings.x_bearer_token,
-            consumer_key=settings.x_api_key,
-            consumer_secret=settings.x_api_secret,
-            access_token=settings.x_access_token,
-            access_token_secret=settings.x_access_token_secret,
+            bearer_token=get_settings().x_bearer_token,
+            consumer_key=get_settings().x_api_key,
+            consumer_secret=get_settings().x_api_secret,
+            access_token=get_settings().x_access_token,
+            access_token_secret=get_settings().x_access_token_secret,
             wait_on_rate_limit=True,
         )
+        
+        # X's write limits are strict, so post fewer at once than the default
+        self.max_concurrent_publishes = get_settings().x_max_concurrent_posts
+
+    @cached_property
+    def username(self) -> str:
+        """Username of the account we post as, fetched once from the API."""
+        user = self.client.get_me()
+        if not user.data:
+            raise ValueError("X API returned no user data")
+        return user.data.username
 
     async def publish_activity(self, activity: Activity, content: str) -> Optional[str]:
         """Publish an activity to X.
@@ -38,14 +69,15 @@ class XPublisher(BasePublisher):
             X post ID if successful, None otherwise
         """
         try:
-            self.logger.info(f"Publishing activity to X: {activity.title}")
+            self.logger.info("Publishing activity to X: {}", activity.title)
             
-            # Post to X using API v2
-            response = self.client.create_tweet(text=content)
+            # Post to X using API v2. Tweepy is synchronous, so the request
+            # runs in a worker thread to keep the event loop free
+            response = await asyncio.to_thread(self.client.create_tweet, text=content)
             
             if response.data:
                 post_id = str(response.data["id"])
-                self.logger.info(f"Successfully posted to X: {post_id}")
+                self.logger.info("Successfully posted to X: {}", post_id)
                 return post_id
             else:
                 self.logger.error("X API returned no data")
@@ -74,7 +106,7 @@ class XPublisher(BasePublisher):
             
             self.logger.info(f"Publishing weekly summary to X")
             
-            response = self.client.create_tweet(text=summary_content)
+            response = await asyncio.to_thread(self.client.create_tweet, text=summary_content)
             
             if response.data:
                 post_id = str(response.data["id"])
@@ -99,27 +131,28 @@ class XPublisher(BasePublisher):
         Returns:
             Formatted summary for X (under 280 characters)
         """
-        # Extract the title from the blog content
-        lines = content.split('\n')
-        title = lines[0].replace('#', '').strip() if lines else f"Weekly Update: {week_start_str} - {week_end_str}"
+        # Extract the title from the first line of the blog content
+        title = self._summary_title(
+            content.partition('\n')[0], week_start_str, week_end_str
+        )
         
         # Create a very concise summary for X's character limit
-        base_content = f"📊 {title}\n\nThis week in #mwmbl: development updates, community activity & progress stats.\n\nRead more: https://mwmbl.github.io/blog/\n\n#opensource #searchengine"
-        
-        # Ensure we're under the character limit
-        if len(base_content) > 280:
-            # Fallback to even shorter version
-            base_content = f"📊 Weekly #mwmbl update: {week_start_str}-{week_end_str}\n\nDevelopment & community updates on our blog:\nhttps://mwmbl.github.io/blog/\n\n#opensource #searchengine"
+        if len(title) <= _MAX_SUMMARY_TITLE_LENGTH:
+            return _SUMMARY_TEMPLATE.format(title=title)
         
-        return base_content
+        # Fallback to even shorter version if the title won't fit
+        return _SHORT_SUMMARY_TEMPLATE.format(
+            week_start=week_start_str, week_end=week_end_str
+        )
 
     async def _test_connection_impl(self) -> bool:
         """Test connection to X."""
         try:
             # Verify credentials by getting user info
-            user = self.client.get_me()
+            user = await asyncio.to_thread(self.client.get_me)
             if user.data:
-                self.logger.info(f"Connected to X as @{user.data.username}")
+                self.username = user.data.username
+                self.logger.info(f"Connected to X as @{self.username}")
                 return True
             else:
                 self.logger.error("X API returned no user data")
@@ -140,9 +173,8 @@ class XPublisher(BasePublisher):
         """
         if not username:
             try:
-                user = self.client.get_me()
-                username = user.data.username if user.data else "unknown"
-            except:
+                username = self.username
+            except Exception:
                 username = "unknown"
         
         return f"https://x.com/{username}/status/{post_id}"
@@ -163,15 +195,13 @@ class XPublisher(BasePublisher):
             for i, tweet_content in enumerate(tweets):
                 self.logger.info(f"Posting tweet {i+1}/{len(tweets)} in thread")
                 
-                if previous_tweet_id:
-                    # Reply to previous tweet to create thread
-                    response = self.client.create_tweet(
-                        text=tweet_content,
-                        in_reply_to_tweet_id=previous_tweet_id
-                    )
-                else:
-                    # First tweet in thread
-                    response = self.client.create_tweet(text=tweet_content)
+                # Each tweet replies to the previous one (the first has none), so
+                # they have to be posted in order
+                response = await asyncio.to_thread(
+                    self.client.create_tweet,
+                    text=tweet_content,
+                    in_reply_to_tweet_id=previous_tweet_id,
+                )
                 
                 if response.data:
                     tweet_id = str(response.data["id"])
@@ -1,16 +1,17 @@
 """Task scheduler for orchestrating data collection and posting."""
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import List, Sequence, Tuple
 
 from loguru import logger
+from sqlalchemy import func, insert, text
 
-from config.settings import settings
+from config.settings import get_settings
 from src.collectors import GitHubCollector, MatrixCollector, MwmblStatsCollector
 from src.processors import AISummarizer, ContentFilter, ContentFormatter
 from src.publishers import BlogPublisher, MastodonPublisher, XPublisher
-from src.storage import Platform, Post, get_db_session
+from src.storage import Activity, Platform, Post, get_db_manager, get_db_session
 
 
 class TaskScheduler:
@@ -39,6 +40,17 @@ class TaskScheduler:
             Platform.BLOG: BlogPublisher(),
         }
 
+    async def aclose(self) -> None:
+        """Release network resources held by the collectors and processors."""
+        resources = [*self.collectors, self.ai_summarizer]
+        results = await asyncio.gather(
+            *(resource.aclose() for resource in resources),
+            return_exceptions=True,
+        )
+        for resource, result in zip(resources, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Error closing {resource.__class__.__name__}: {result}")
+
     async def run_data_collection(self, since: datetime = None) -> int:
         """Run data collection from all sources.
         
@@ -52,12 +64,18 @@ class TaskScheduler:
         
         total_collected = 0
         
-        for collector in self.collectors:
-            try:
-                collected = await collector.run_collection(since)
-                total_collected += collected
-            except Exception as e:
-                self.logger.error(f"Error in collector {collector.__class__.__name__}: {e}")
+        # Collectors talk to independent services and save through their own
+        # sessions, so run them concurrently
+        results = await asyncio.gather(
+            *(collector.run_collection(since) for collector in self.collectors),
+            return_exceptions=True,
+        )
+        
+        for collector, result in zip(self.collectors, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in collector {collector.__class__.__name__}: {result}")
+            else:
+                total_collected += result
         
         self.logger.info(f"Data collection completed: {total_collected} total activities")
         return total_collected
@@ -71,12 +89,22 @@ class TaskScheduler:
         self.logger.info("Starting daily posting process")
         
         results = {}
-        since = datetime.now() - timedelta(days=1)  # Last 24 hours
+        since = datetime.now(timezone.utc) - timedelta(days=1)  # Last 24 hours
+        platforms = [Platform.MASTODON, Platform.X]
+        
+        # Fetch the candidates for every platform in one go
+        try:
+            activities_by_platform = self.content_filter.get_newsworthy_activities_by_platform(
+                since, platforms
+            )
+        except Exception as e:
+            self.logger.error(f"Error getting newsworthy activities: {e}")
+            return {platform.value: {"success": False, "error": str(e)} for platform in platforms}
         
         # Post to Mastodon and X
-        for platform in [Platform.MASTODON, Platform.X]:
+        for platform in platforms:
             try:
-                result = await self._post_to_platform(platform, since)
+                result = await self._post_to_platform(platform, activities_by_platform[platform])
                 results[platform.value] = result
             except Exception as e:
                 self.logger.error(f"Error posting to {platform.value}: {e}")
@@ -93,12 +121,13 @@ class TaskScheduler:
         """
         self.logger.info("Starting weekly posting process")
         
-        # Calculate week boundaries (Monday to Sunday)
-        today = datetime.now()
+        # Calculate week boundaries (Monday to Sunday), in UTC to match the
+        # timestamptz columns they're compared against
+        today = datetime.now(timezone.utc)
         days_since_monday = today.weekday()
-        week_start = today - timedelta(days=days_since_monday, hours=today.hour, 
-                                     minutes=today.minute, seconds=today.second, 
-                                     microseconds=today.microsecond)
+        week_start = today.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
+            days=days_since_monday
+        )
         week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
         
         try:
@@ -109,10 +138,16 @@ class TaskScheduler:
                 self.logger.info("No activities found for weekly summary")
                 return {"success": True, "message": "No activities to summarize"}
             
-            # Generate AI summary
-            summary_content = await self.ai_summarizer.generate_weekly_summary(
-                activities, week_start, week_end
-            )
+            if len(activities) < get_settings().min_ai_summary_activities:
+                # Too little happened to be worth an AI summary
+                summary_content = self.content_formatter.format_weekly_minimal(
+                    activities, week_start, week_end
+                )
+            else:
+                # Generate AI summary
+                summary_content = await self.ai_summarizer.generate_weekly_summary(
+                    activities, week_start, week_end
+                )
             
             # Post to blog
             blog_publisher = self.publishers[Platform.BLOG]
@@ -140,45 +175,47 @@ class TaskScheduler:
             self.logger.error(f"Error in weekly posting: {e}")
             return {"success": False, "error": str(e)}
 
-    async def _post_to_platform(self, platform: Platform, since: datetime) -> dict:
+    async def _post_to_platform(
+        self, platform: Platform, activities: List[Activity]
+    ) -> dict:
         """Post newsworthy activities to a specific platform.
         
         Args:
             platform: The platform to post to
-            since: Only consider activities created after this datetime
+            activities: Newsworthy activities not yet posted to the platform
             
         Returns:
             Dictionary with posting results
         """
         try:
-            # Get newsworthy activities
-            activities = self.content_filter.get_newsworthy_activities(since, platform)
-            
             if not activities:
                 return {"success": True, "message": "No newsworthy activities to post"}
             
             publisher = self.publishers[platform]
-            posted_count = 0
             
+            # Format content for the platform
+            items = []
             for activity in activities:
                 try:
-                    # Format content for the platform
-                    formatted_content = self.content_formatter.format_activity(activity, platform)
-                    
-                    # Publish the activity
-                    post_id = await publisher.publish_activity(activity, formatted_content)
-                    
-                    if post_id:
-                        # Mark as posted
-                        self.content_filter.mark_activity_as_posted(activity, platform, post_id)
-                        posted_count += 1
-                    
+                    items.append(
+                        (activity, self.content_formatter.format_activity(activity, platform))
+                    )
                 except Exception as e:
-                    self.logger.error(f"Error posting activity {activity.id} to {platform.value}: {e}")
+                    self.logger.error(f"Error formatting activity {activity.id} for {platform.value}: {e}")
+            
+            # Publish the activities together, then mark everything that went
+            # out as posted in one transaction
+            post_ids = await publisher.publish_activities(items)
+            posted = [
+                (activity, post_id)
+                for (activity, _), post_id in zip(items, post_ids)
+                if post_id
+            ]
+            self.content_filter.mark_activities_as_posted(posted, platform)
             
             return {
                 "success": True,
-                "posted_count": posted_count,
+                "posted_count": len(posted),
                 "total_activities": len(activities)
             }
             
@@ -198,22 +235,31 @@ class TaskScheduler:
         """
         week_start_str = week_start.strftime("%Y-%m-%d")
         week_end_str = week_end.strftime("%Y-%m-%d")
+        platforms = [Platform.MASTODON, Platform.X]
         
-        for platform in [Platform.MASTODON, Platform.X]:
-            try:
-                publisher = self.publishers[platform]
-                post_id = await publisher.publish_weekly_summary(
+        # Announce on every platform at once
+        results = await asyncio.gather(
+            *(
+                self.publishers[platform].publish_weekly_summary(
                     summary_content, week_start_str, week_end_str
                 )
-                
-                if post_id:
-                    await self._record_weekly_summary_post(
-                        platform, post_id, summary_content, week_start, week_end
-                    )
-                    self.logger.info(f"Weekly summary announced on {platform.value}: {post_id}")
-                
-            except Exception as e:
-                self.logger.error(f"Error announcing weekly summary on {platform.value}: {e}")
+                for platform in platforms
+            ),
+            return_exceptions=True,
+        )
+        
+        posted = []
+        for platform, result in zip(platforms, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error announcing weekly summary on {platform.value}: {result}")
+            elif result:
+                posted.append((platform, result))
+                self.logger.info(f"Weekly summary announced on {platform.value}: {result}")
+        
+        # Record all the announcements in one transaction
+        await self._record_weekly_summary_posts(
+            posted, summary_content, week_start, week_end
+        )
 
     async def _record_weekly_summary_post(
         self, platform: Platform, post_id: str, content: str, 
@@ -228,21 +274,45 @@ class TaskScheduler:
             week_start: Start of the week
             week_end: End of the week
         """
+        await self._record_weekly_summary_posts(
+            [(platform, post_id)], content, week_start, week_end
+        )
+
+    async def _record_weekly_summary_posts(
+        self, posted: Sequence[Tuple[Platform, str]], content: str,
+        week_start: datetime, week_end: datetime
+    ) -> None:
+        """Record weekly summary posts on several platforms in one transaction.
+        
+        Args:
+            posted: Pairs of platform and the platform-specific post ID
+            content: The post content
+            week_start: Start of the week
+            week_end: End of the week
+        """
+        if not posted:
+            return
+        
         try:
-            with get_db_session() as session:
-                post = Post(
-                    platform=platform,
-                    platform_post_id=post_id,
-                    content=content[:1000],  # Truncate for storage
-                    is_weekly_summary=True,
-                    week_start=week_start,
-                    week_end=week_end,
+            # Plain Core insert; nothing uses the rows as ORM objects afterwards
+            with get_db_manager().engine.begin() as conn:
+                conn.execute(
+                    insert(Post),
+                    [
+                        {
+                            "platform": platform,
+                            "platform_post_id": post_id,
+                            "content": content[:1000],  # Truncate for storage
+                            "is_weekly_summary": True,
+                            "week_start": week_start,
+                            "week_end": week_end,
+                        }
+                        for platform, post_id in posted
+                    ],
                 )
-                session.add(post)
-                session.commit()
                 
         except Exception as e:
-            self.logger.error(f"Error recording weekly summary post: {e}")
+            self.logger.error(f"Error recording weekly summary posts: {e}")
 
     async def test_all_connections(self) -> dict:
         """Test connections to all external services.
@@ -254,33 +324,41 @@ class TaskScheduler:
         
         results = {}
         
+        # The services are independent, so test them all concurrently
+        publishers = list(self.publishers.items())
+        since = datetime.now() - timedelta(hours=1)
+        outcomes = await asyncio.gather(
+            *(publisher.test_connection() for _, publisher in publishers),
+            # Test collectors by trying to collect recent activities (last hour)
+            *(collector.collect(since) for collector in self.collectors),
+            return_exceptions=True,
+        )
+        publisher_outcomes = outcomes[:len(publishers)]
+        collector_outcomes = outcomes[len(publishers):]
+        
         # Test publishers
-        for platform, publisher in self.publishers.items():
-            try:
-                connected = await publisher.test_connection()
-                results[f"{platform.value}_publisher"] = connected
-            except Exception as e:
-                self.logger.error(f"Error testing {platform.value} publisher: {e}")
+        for (platform, _), outcome in zip(publishers, publisher_outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Error testing {platform.value} publisher: {outcome}")
                 results[f"{platform.value}_publisher"] = False
+            else:
+                results[f"{platform.value}_publisher"] = outcome
         
         # Test collectors
-        for collector in self.collectors:
+        for collector, outcome in zip(self.collectors, collector_outcomes):
             collector_name = collector.__class__.__name__.lower().replace('collector', '')
-            try:
-                # Test by trying to collect recent activities (last hour)
-                since = datetime.now() - timedelta(hours=1)
-                activities = await collector.collect(since)
-                results[f"{collector_name}_collector"] = True
-                self.logger.info(f"{collector_name} collector test passed: {len(activities)} activities")
-            except Exception as e:
-                self.logger.error(f"Error testing {collector_name} collector: {e}")
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Error testing {collector_name} collector: {outcome}")
                 results[f"{collector_name}_collector"] = False
+            else:
+                results[f"{collector_name}_collector"] = True
+                self.logger.info(f"{collector_name} collector test passed: {len(outcome)} activities")
         
-        # Test database connection
+        # Test database connection with a plain pooled connection; a ping
+        # doesn't need an ORM session
         try:
-            from sqlalchemy import text
-            with get_db_session() as session:
-                session.execute(text("SELECT 1"))
+            with get_db_manager().engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
             results["database"] = True
         except Exception as e:
             self.logger.error(f"Database connection test failed: {e}")
@@ -298,27 +376,31 @@ class TaskScheduler:
         Returns:
             Dictionary with posting statistics
         """
-        since = datetime.now() - timedelta(days=days)
+        since = datetime.now(timezone.utc) - timedelta(days=days)
         
         with get_db_session() as session:
-            posts = session.query(Post).filter(Post.posted_at >= since).all()
-            
-            stats = {
-                "total_posts": len(posts),
-                "by_platform": {},
-                "weekly_summaries": 0,
-                "individual_posts": 0,
-            }
+            # Count in the database rather than loading every post
+            counts = (
+                session.query(Post.platform, Post.is_weekly_summary, func.count())
+                .filter(Post.posted_at >= since)
+                .group_by(Post.platform, Post.is_weekly_summary)
+                .all()
+            )
+        
+        stats = {
+            "total_posts": 0,
+            "by_platform": {},
+            "weekly_summaries": 0,
+            "individual_posts": 0,
+        }
+        
+        for platform, is_weekly_summary, count in counts:
+            stats["total_posts"] += count
+            stats["by_platform"][platform.value] = stats["by_platform"].get(platform.value, 0) + count
             
-            for post in posts:
-                platform = post.platform.value
-                if platform not in stats["by_platform"]:
-                    stats["by_platform"][platform] = 0
-                stats["by_platform"][platform] += 1
-                
-                if post.is_weekly_summary:
-                    stats["weekly_summaries"] += 1
-                else:
-                    stats["individual_posts"] += 1
+            if is_weekly_summary:
+                stats["weekly_summaries"] += count
+            else:
+                stats["individual_posts"] += count
         
         return stats
@@ -1,6 +1,26 @@
 """Storage layer for the posting system."""
 
-from .database import DatabaseManager, db_manager, get_db_session
-from .models import Activity, ActivityType, Platform, Post, Base
+from typing import Any
 
-__all__ = ["DatabaseManager", "db_manager", "get_db_session", "Activity", "ActivityType", "Platform", "Post", "Base"]
+from .database import DatabaseManager, get_db_manager, get_db_session
+from .models import Activity, ActivityType, Platform, Post, Summary, Base
+
+__all__ = (
+    "DatabaseManager",
+    "db_manager",
+    "get_db_manager",
+    "get_db_session",
+    "Activity",
+    "ActivityType",
+    "Platform",
+    "Post",
+    "Summary",
+    "Base",
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily provide the legacy package-level ``db_manager`` instance."""
+    if name == "db_manager":
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
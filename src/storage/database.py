@@ -1,13 +1,14 @@
 """Database connection and session management."""
 
 from contextlib import contextmanager
-from typing import Generator
+from functools import lru_cache
+from typing import Any, Generator
 
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
-from config.settings import settings
+from config.settings import get_settings
 from .models import Base
 
 
@@ -17,10 +18,12 @@ class DatabaseManager:
     def __init__(self) -> None:
         """Initialize the database manager."""
         self.engine = create_engine(
-            settings.database_url,
-            echo=settings.log_level.upper() == "DEBUG",
+            get_settings().database_url,
+            echo=get_settings().log_level.upper() == "DEBUG",
+            pool_size=10,
+            max_overflow=20,
             pool_pre_ping=True,
-            pool_recycle=3600,
+            pool_recycle=1800,
         )
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
@@ -32,6 +35,20 @@ class DatabaseManager:
         Base.metadata.create_all(bind=self.engine)
         logger.info("Database tables created successfully")
 
+    def tables_exist(self) -> bool:
+        """Check whether every model table already exists.
+
+        Uses a single ``to_regclass`` query rather than issuing DDL.
+        """
+        names = list(Base.metadata.tables)
+        columns = ", ".join(f"to_regclass(:t{i})" for i in range(len(names)))
+        params = {f"t{i}": name for i, name in enumerate(names)}
+
+        with self.engine.connect() as conn:
+            row = conn.execute(text(f"SELECT {columns}"), params).one()
+
+        return all(oid is not None for oid in row)
+
     def drop_tables(self) -> None:
         """Drop all database tables."""
         logger.warning("Dropping all database tables...")
@@ -53,12 +70,21 @@ class DatabaseManager:
             session.close()
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+@lru_cache(maxsize=1)
+def get_db_manager() -> DatabaseManager:
+    """Get the process-wide database manager, creating the engine on first use."""
+    return DatabaseManager()
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily provide the legacy module-level ``db_manager`` instance."""
+    if name == "db_manager":
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """Convenience function to get a database session."""
-    with db_manager.get_session() as session:
+    with get_db_manager().get_session() as session:
         yield session
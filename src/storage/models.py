@@ -2,17 +2,19 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from sqlalchemy import (
     Boolean,
     DateTime,
     Enum as SQLEnum,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -59,10 +61,14 @@ class Activity(Base):
         DateTime(timezone=True), server_default=func.now()
     )
     is_newsworthy: Mapped[bool] = mapped_column(Boolean, default=False)
-    extra_data: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
+    extra_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONB(none_as_null=True), nullable=True
+    )
 
     __table_args__ = (
         UniqueConstraint("activity_type", "source_id", name="unique_activity"),
+        Index("ix_activities_created_at", "created_at"),
+        Index("ix_activities_newsworthy_created", "is_newsworthy", "created_at"),
     )
 
     def __repr__(self) -> str:
@@ -92,5 +98,38 @@ class Post(Base):
         DateTime(timezone=True), nullable=True
     )
 
+    __table_args__ = (
+        Index("ix_posts_activity_platform", "activity_id", "platform"),
+        Index("ix_posts_platform_posted_at", "platform", "posted_at"),
+        Index(
+            "ix_posts_posted_platform_weekly",
+            "posted_at",
+            "platform",
+            "is_weekly_summary",
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Post(id={self.id}, platform={self.platform}, posted_at={self.posted_at})>"
+
+
+class Summary(Base):
+    """Model for caching AI-generated summaries."""
+
+    __tablename__ = "summaries"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    activity_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    kind: Mapped[str] = mapped_column(String(50))  # e.g. "weekly" or "social"
+    content_hash: Mapped[str] = mapped_column(String(32))  # Hash of model and prompt
+    text: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint("kind", "content_hash", name="unique_summary"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<Summary(id={self.id}, kind={self.kind}, activity_id={self.activity_id})>"
@@ -0,0 +1,34 @@
+"""Shared test fixtures."""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from config.settings import get_settings
+
+# Settings without a default, so a Settings instance can be built in tests
+_REQUIRED_SETTINGS = (
+    "MATRIX_USERNAME",
+    "MATRIX_PASSWORD",
+    "GITHUB_TOKEN",
+    "MASTODON_INSTANCE_URL",
+    "MASTODON_ACCESS_TOKEN",
+    "X_API_KEY",
+    "X_API_SECRET",
+    "X_ACCESS_TOKEN",
+    "X_ACCESS_TOKEN_SECRET",
+    "X_BEARER_TOKEN",
+    "ANTHROPIC_API_KEY",
+)
+
+
+@pytest.fixture(autouse=True)
+def settings_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[None]:
+    """Provide dummy settings and reload them for every test."""
+    for name in _REQUIRED_SETTINGS:
+        monkeypatch.setenv(name, "test")
+    monkeypatch.setenv("BLOG_REPO_PATH", str(tmp_path / "blog"))
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
@@ -0,0 +1,78 @@
+"""Tests for the AI summarizer's summary cache."""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.dialects import postgresql
+
+from src.processors import ai_summarizer
+from src.processors.ai_summarizer import AISummarizer
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the summarizer's database sessions with a mock session."""
+    session = MagicMock()
+
+    @contextmanager
+    def fake_db_session() -> Iterator[MagicMock]:
+        yield session
+
+    monkeypatch.setattr(ai_summarizer, "get_db_session", fake_db_session)
+    return session
+
+
+@pytest_asyncio.fixture
+async def summarizer() -> AISummarizer:
+    """Summarizer whose Claude client is a mock."""
+    summarizer = AISummarizer()
+    await summarizer.aclose()
+    summarizer.client = MagicMock()
+    summarizer.client.messages.create = AsyncMock(
+        return_value=SimpleNamespace(content=[SimpleNamespace(text="fresh summary")])
+    )
+    return summarizer
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_claude(
+    summarizer: AISummarizer, session: MagicMock
+) -> None:
+    session.scalar.return_value = "cached summary"
+
+    text = await summarizer._complete(
+        "social", "prompt", model="model", max_tokens=10, temperature=0.5
+    )
+
+    assert text == "cached summary"
+    summarizer.client.messages.create.assert_not_awaited()
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_stores_summary(
+    summarizer: AISummarizer, session: MagicMock
+) -> None:
+    session.scalar.return_value = None
+
+    text = await summarizer._complete(
+        "social",
+        "prompt",
+        model="model",
+        max_tokens=10,
+        temperature=0.5,
+        activity_id=7,
+    )
+
+    assert text == "fresh summary"
+    summarizer.client.messages.create.assert_awaited_once()
+    session.execute.assert_called_once()
+    stmt = session.execute.call_args.args[0]
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert params["kind"] == "social"
+    assert params["text"] == "fresh summary"
+    assert params["activity_id"] == 7
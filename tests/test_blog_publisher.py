@@ -0,0 +1,36 @@
+"""Tests for the blog publisher."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.publishers.blog_publisher import BlogPublisher
+from src.storage import Activity, ActivityType
+
+
+def _activity(title: str) -> Activity:
+    return Activity(
+        activity_type=ActivityType.GITHUB_RELEASE,
+        source_id=f"release_{title}",
+        title=title,
+        content="Release notes",
+    )
+
+
+@pytest.mark.asyncio
+async def test_same_title_activities_get_separate_posts() -> None:
+    publisher = BlogPublisher()
+    publisher._write_and_commit_posts = AsyncMock(return_value=True)
+    items = [
+        (_activity("Release v1.0"), "First"),
+        (_activity("Release v1.0"), "Second"),
+        (_activity("Release v1.0"), "Third"),
+    ]
+
+    filenames = await publisher.publish_activities(items)
+
+    assert len(set(filenames)) == 3
+    posts = publisher._write_and_commit_posts.await_args.args[0]
+    assert sorted(posts) == sorted(filenames)
+    assert filenames[1] == filenames[0].replace(".md", "-2.md")
+    assert filenames[2] == filenames[0].replace(".md", "-3.md")